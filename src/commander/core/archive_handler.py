@@ -425,6 +425,23 @@ class ArchiveManager:
 
         return False
 
+    @classmethod
+    def get_first_volume(cls, path: Path) -> Path:
+        """Get the first volume of a split archive (path itself if not a later part)."""
+        if not cls.is_split_archive_part(path):
+            return path
+
+        name = path.name
+        # .part2.rar -> .part1.rar, .7z.002 -> .7z.001 (same number of digits)
+        match = re.search(r"\.part(\d+)\.rar$|\.7z\.(\d{3,})$", name, re.IGNORECASE)
+        if match:
+            group = 1 if match.group(1) else 2
+            first = "1".zfill(len(match.group(group)))
+            return path.with_name(name[: match.start(group)] + first + name[match.end(group) :])
+
+        # Old style .r00, .r01, ... -> .rar
+        return path.with_name(re.sub(r"\.r\d{2,}$", ".rar", name, flags=re.IGNORECASE))
+
     @classmethod
     def get_handler(cls, archive_path: Path) -> ArchiveHandler | None:
         """Get appropriate handler for archive."""
@@ -484,6 +501,32 @@ class ArchiveManager:
         if handler is None:
             raise ValueError(f"Unsupported archive format: {archive_path.suffix}")
 
+        extract_dir, _root = cls._smart_extract_dirs(handler, archive_path, base_destination)
+        extract_dir.mkdir(parents=True, exist_ok=True)
+        handler.extract_all(extract_dir)
+        handler.close()
+        return extract_dir
+
+    @classmethod
+    def smart_extract_root(cls, archive_path: Path, base_destination: Path) -> Path:
+        """Get the top-level path smart_extract() writes into.
+
+        This is the archive's single top-level folder, or the folder named after the archive.
+        """
+        handler = cls.get_handler(archive_path)
+        if handler is None:
+            raise ValueError(f"Unsupported archive format: {archive_path.suffix}")
+
+        try:
+            return cls._smart_extract_dirs(handler, archive_path, base_destination)[1]
+        finally:
+            handler.close()
+
+    @classmethod
+    def _smart_extract_dirs(
+        cls, handler: ArchiveHandler, archive_path: Path, base_destination: Path
+    ) -> tuple[Path, Path]:
+        """Get (directory to extract into, top-level path written) for smart extraction."""
         # Get top-level entries
         entries = handler.list_entries()
         top_level_dirs = [e for e in entries if e.is_dir and "/" not in e.name.rstrip("/")]
@@ -492,17 +535,12 @@ class ArchiveManager:
         # Check if there's exactly one top-level folder and no top-level files
         if len(top_level_dirs) == 1 and len(top_level_files) == 0:
             # Single top-level folder - extract directly
-            extract_dir = base_destination
-        else:
-            # Multiple items or files at top level - create wrapper folder
-            # Get proper stem for split archives
-            stem = cls._get_archive_stem(archive_path)
-            extract_dir = base_destination / stem
+            return base_destination, base_destination / top_level_dirs[0].name.rstrip("/")
 
-        extract_dir.mkdir(parents=True, exist_ok=True)
-        handler.extract_all(extract_dir)
-        handler.close()
-        return extract_dir
+        # Multiple items or files at top level - create wrapper folder
+        # Get proper stem for split archives
+        stem = cls._get_archive_stem(archive_path)
+        return base_destination / stem, base_destination / stem
 
     @classmethod
     def _get_archive_stem(cls, archive_path: Path) -> str:
@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Optional
 
 from .database import get_database
+from .tag_system import get_tag_manager
 
 
 @dataclass
@@ -152,6 +153,7 @@ class LibraryManager:
         """Delete library and all its assets."""
         self._db.execute("DELETE FROM libraries WHERE id = ?", (library_id,))
         self._db.commit()
+        get_tag_manager().invalidate_library_tags()
 
     def get_library_stats(self, library_id: int) -> dict:
         """Get statistics for a library."""
@@ -380,6 +382,7 @@ class LibraryManager:
         """Delete an asset."""
         self._db.execute("DELETE FROM assets WHERE id = ?", (asset_id,))
         self._db.commit()
+        get_tag_manager().invalidate_library_tags()
 
     def mark_assets_missing(self, library_id: int) -> int:
         """Mark all assets in library as missing (for re-scan).
@@ -405,6 +408,7 @@ class LibraryManager:
             (library_id,),
         )
         self._db.commit()
+        get_tag_manager().invalidate_library_tags()
         return cursor.rowcount
 
     # === Asset Tags ===
@@ -434,6 +438,7 @@ class LibraryManager:
             (asset_id, tag_id),
         )
         self._db.commit()
+        get_tag_manager().invalidate_library_tags()
 
     def remove_tag_from_asset(self, asset_id: int, tag_id: int) -> None:
         """Remove a tag from an asset."""
@@ -442,6 +447,7 @@ class LibraryManager:
             (asset_id, tag_id),
         )
         self._db.commit()
+        get_tag_manager().invalidate_library_tags()
 
     def get_asset_tag_ids(self, asset_id: int) -> list[int]:
         """Get tag IDs for an asset."""
@@ -54,6 +54,8 @@ class TagManager:
         if self._initialized:
             return
         self._db = get_database()
+        # library_id -> tags used in that library; cleared whenever asset tags change
+        self._library_tags_cache: dict[int, list[Tag]] = {}
         self._initialized = True
 
     # === Tag Parsing ===
@@ -241,11 +243,13 @@ class TagManager:
             tuple(params),
         )
         self._db.commit()
+        self.invalidate_library_tags()
 
     def delete_tag(self, tag_id: int) -> None:
         """Delete a tag (also removes from all assets)."""
         self._db.execute("DELETE FROM tags WHERE id = ?", (tag_id,))
         self._db.commit()
+        self.invalidate_library_tags()
 
     def get_tag_usage_count(self, tag_id: int) -> int:
         """Get number of assets using this tag."""
@@ -396,7 +400,11 @@ class TagManager:
     # === Library-specific tag operations ===
 
     def get_library_tags(self, library_id: int) -> list[Tag]:
-        """Get all tags used in a library."""
+        """Get all tags used in a library (cached until asset tags change)."""
+        cached = self._library_tags_cache.get(library_id)
+        if cached is not None:
+            return list(cached)
+
         rows = self._db.fetchall(
             """
             SELECT DISTINCT t.* FROM tags t
@@ -407,7 +415,13 @@ class TagManager:
             """,
             (library_id,),
         )
-        return [Tag.from_row(row) for row in rows]
+        tags = [Tag.from_row(row) for row in rows]
+        self._library_tags_cache[library_id] = tags
+        return list(tags)
+
+    def invalidate_library_tags(self) -> None:
+        """Drop cached library tag lists (call after asset tags change)."""
+        self._library_tags_cache.clear()
 
     def get_library_tag_counts(self, library_id: int) -> dict[int, int]:
         """Get tag usage counts for a library.
@@ -12,7 +12,7 @@ from commander.utils.settings import Settings
 class ThumbnailWorker(QThread):
     """Background worker for generating thumbnails."""
 
-    thumbnail_ready = Signal(str, QPixmap)  # path_str, pixmap
+    thumbnail_ready = Signal(str, QPixmap, QSize)  # path_str, pixmap, requested size
 
     def __init__(self, path: Path, size: QSize):
         super().__init__()
@@ -29,7 +29,7 @@ class ThumbnailWorker(QThread):
                     Qt.AspectRatioMode.KeepAspectRatio,
                     Qt.TransformationMode.SmoothTransformation,
                 )
-                self.thumbnail_ready.emit(str(self._path), scaled)
+                self.thumbnail_ready.emit(str(self._path), scaled, self._size)
         except Exception:
             pass
 
@@ -41,6 +41,7 @@ class ThumbnailProvider(QObject):
     - LRU cache with configurable size
     - Concurrent loading limit to prevent resource exhaustion
     - Only loads visible items (when used with delegate)
+    - Per-caller target sizes, so views don't rescale while painting
     """
 
     SUPPORTED_FORMATS = ALL_IMAGE_FORMATS
@@ -51,9 +52,10 @@ class ThumbnailProvider(QObject):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._settings = Settings()
-        self._cache: dict[str, QPixmap] = {}
-        self._pending: dict[str, ThumbnailWorker] = {}
-        self._queue: list[Path] = []  # Paths waiting to be loaded
+        self._cache: dict[str, QPixmap] = {}  # cache key -> scaled pixmap
+        self._pending: dict[str, ThumbnailWorker] = {}  # cache key -> worker
+        self._queue: list[tuple[Path, QSize]] = []  # (path, size) waiting to be loaded
+        self._queued: set[str] = set()  # cache keys in _queue
         self._max_cache_size = self._settings.load_thumbnail_cache_size()
         size = self._settings.load_thumbnail_size()
         self._thumbnail_size = QSize(size, size)
@@ -64,33 +66,60 @@ class ThumbnailProvider(QObject):
             self._thumbnail_size = size
             self._cache.clear()
 
-    def get_thumbnail(self, path: Path) -> QPixmap | None:
-        """Get thumbnail for path. Returns None if not cached yet."""
-        path_str = str(path)
+    def _cache_key(self, path_str: str, size: QSize) -> str:
+        """Cache key for path at size (plain path string for the default size)."""
+        if size == self._thumbnail_size:
+            return path_str
+        return f"{path_str}|{size.width()}x{size.height()}"
+
+    def get_thumbnail(self, path: Path, size: QSize | None = None) -> QPixmap | None:
+        """Get thumbnail for path scaled to fit size (default: the provider's size).
+
+        Returns None if not cached yet.
+        """
+        size = size or self._thumbnail_size
+        key = self._cache_key(str(path), size)
 
         # Check cache
-        if path_str in self._cache:
-            return self._cache[path_str]
+        pixmap = self._cache.get(key)
+        if pixmap is not None:
+            return pixmap
 
         # Check if supported format
         if path.suffix.lower() not in self.SUPPORTED_FORMATS:
             return None
 
         # Check if already loading
-        if path_str in self._pending:
+        if key in self._pending:
             return None
 
         # Start loading
-        self._load_thumbnail(path)
+        self._load_thumbnail(path, size, key)
         return None
 
-    def _load_thumbnail(self, path: Path):
-        """Queue thumbnail for loading."""
-        path_str = str(path)
+    def prefetch(self, paths: list[Path], size: QSize | None = None):
+        """Queue thumbnails for paths ahead of painting, in the given priority order."""
+        size = size or self._thumbnail_size
+        for path in paths:
+            key = self._cache_key(str(path), size)
+            if (
+                key in self._cache
+                or key in self._pending
+                or key in self._queued
+                or path.suffix.lower() not in self.SUPPORTED_FORMATS
+            ):
+                continue
+            self._queue.append((path, size))
+            self._queued.add(key)
 
+        self._process_queue()
+
+    def _load_thumbnail(self, path: Path, size: QSize, key: str):
+        """Queue thumbnail for loading."""
         # Add to queue if not already there
-        if path not in self._queue and path_str not in self._pending:
-            self._queue.append(path)
+        if key not in self._queued and key not in self._pending:
+            self._queue.append((path, size))
+            self._queued.add(key)
 
         # Process queue
         self._process_queue()
@@ -98,26 +127,27 @@ class ThumbnailProvider(QObject):
     def _process_queue(self):
         """Process queued thumbnails up to concurrent limit."""
         while self._queue and len(self._pending) < self.MAX_CONCURRENT_LOADS:
-            path = self._queue.pop(0)
-            path_str = str(path)
+            path, size = self._queue.pop(0)
+            key = self._cache_key(str(path), size)
+            self._queued.discard(key)
 
             # Skip if already in cache (loaded while queued)
-            if path_str in self._cache:
+            if key in self._cache:
                 continue
 
             # Skip if already loading
-            if path_str in self._pending:
+            if key in self._pending:
                 continue
 
             # Start loading
-            worker = ThumbnailWorker(path, self._thumbnail_size)
+            worker = ThumbnailWorker(path, size)
             worker.thumbnail_ready.connect(self._on_thumbnail_ready)
-            worker.finished.connect(lambda p=path_str: self._on_worker_finished(p))
+            worker.finished.connect(lambda k=key: self._on_worker_finished(k))
 
-            self._pending[path_str] = worker
+            self._pending[key] = worker
             worker.start()
 
-    def _on_thumbnail_ready(self, path_str: str, pixmap: QPixmap):
+    def _on_thumbnail_ready(self, path_str: str, pixmap: QPixmap, size: QSize):
         """Handle thumbnail ready."""
         # Manage cache size
         if len(self._cache) >= self._max_cache_size:
@@ -126,13 +156,13 @@ class ThumbnailProvider(QObject):
             for key in keys_to_remove:
                 del self._cache[key]
 
-        self._cache[path_str] = pixmap
+        self._cache[self._cache_key(path_str, size)] = pixmap
         self.thumbnail_ready.emit(path_str)
 
-    def _on_worker_finished(self, path_str: str):
+    def _on_worker_finished(self, key: str):
         """Clean up finished worker and process queue."""
-        if path_str in self._pending:
-            worker = self._pending.pop(path_str)
+        if key in self._pending:
+            worker = self._pending.pop(key)
             worker.deleteLater()
 
         # Process more from queue
@@ -142,6 +172,10 @@ class ThumbnailProvider(QObject):
         """Clear thumbnail cache."""
         self._cache.clear()
 
+    def supported_extensions(self) -> frozenset[str]:
+        """Get the lowercase file suffixes (with dot) thumbnails can be made for."""
+        return frozenset(self.SUPPORTED_FORMATS)
+
     def is_supported(self, path: Path) -> bool:
         """Check if path is a supported image format."""
         return path.suffix.lower() in self.SUPPORTED_FORMATS
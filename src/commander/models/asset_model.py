@@ -23,6 +23,8 @@ class AssetTableModel(QAbstractTableModel):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._assets: list[Asset] = []
+        self._row_by_id: dict[int, int] = {}
+        self._search_haystack: list[str] = []
         self._library_id: Optional[int] = None
         self._thumbnail_provider = get_thumbnail_provider()
         self._thumbnail_provider.thumbnail_ready.connect(self._on_thumbnail_ready)
@@ -69,9 +71,26 @@ class AssetTableModel(QAbstractTableModel):
                 rating_min=rating_min,
                 include_missing=False,
             )
+        self._rebuild_index()
 
         self.endResetModel()
 
+    def _rebuild_index(self) -> None:
+        """Rebuild asset ID -> row lookup and search strings."""
+        self._row_by_id = {asset.id: row for row, asset in enumerate(self._assets)}
+        self._search_haystack = [self._make_haystack(asset) for asset in self._assets]
+
+    @staticmethod
+    def _make_haystack(asset: Asset) -> str:
+        """Build lowercased search string (name and tags, newline separated)."""
+        return f"{asset.original_filename}\n{', '.join(asset.tags)}".lower()
+
+    def matches_search(self, row: int, needle: str) -> bool:
+        """Check if a row's name or tags contain needle (already lowercased)."""
+        if 0 <= row < len(self._search_haystack):
+            return needle in self._search_haystack[row]
+        return False
+
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         if parent.isValid():
             return 0
@@ -174,32 +193,37 @@ class AssetTableModel(QAbstractTableModel):
 
     def get_asset_by_id(self, asset_id: int) -> Optional[Asset]:
         """Get asset by ID."""
-        for asset in self._assets:
-            if asset.id == asset_id:
-                return asset
-        return None
+        row = self._row_by_id.get(asset_id)
+        return self._assets[row] if row is not None else None
 
     def get_row_by_id(self, asset_id: int) -> int:
         """Get row index by asset ID."""
-        for i, asset in enumerate(self._assets):
-            if asset.id == asset_id:
-                return i
-        return -1
+        return self._row_by_id.get(asset_id, -1)
 
     def update_asset(self, asset_id: int) -> None:
         """Refresh a single asset's data."""
-        row = self.get_row_by_id(asset_id)
-        if row < 0:
-            return
+        self.update_assets([asset_id])
 
-        # Reload asset from database
+    def update_assets(self, asset_ids: list[int]) -> None:
+        """Refresh several assets' data, emitting a single dataChanged."""
         lib_manager = get_library_manager()
-        updated = lib_manager.get_asset(asset_id)
-
-        if updated:
-            self._assets[row] = updated
-            top_left = self.index(row, 0)
-            bottom_right = self.index(row, len(self.COLUMNS) - 1)
+        rows = []
+
+        for asset_id in asset_ids:
+            row = self._row_by_id.get(asset_id)
+            if row is None:
+                continue
+
+            # Reload asset from database
+            updated = lib_manager.get_asset(asset_id)
+            if updated:
+                self._assets[row] = updated
+                self._search_haystack[row] = self._make_haystack(updated)
+                rows.append(row)
+
+        if rows:
+            top_left = self.index(min(rows), 0)
+            bottom_right = self.index(max(rows), len(self.COLUMNS) - 1)
             self.dataChanged.emit(top_left, bottom_right)
 
 
@@ -212,9 +236,17 @@ class AssetFilterProxyModel(QSortFilterProxyModel):
         self.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
 
     def set_search_text(self, text: str) -> None:
-        """Set search filter text."""
-        self._search_text = text.lower()
-        self.invalidateFilter()
+        """Set search filter text.
+
+        Uses a model reset rather than invalidateFilter(): for large libraries a
+        single reset is much cheaper than per-row insert/remove notifications.
+        """
+        text = text.lower()
+        if text == self._search_text:
+            return
+        self.beginResetModel()
+        self._search_text = text
+        self.endResetModel()
 
     def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
         if not self._search_text:
@@ -224,19 +256,8 @@ class AssetFilterProxyModel(QSortFilterProxyModel):
         if model is None:
             return True
 
-        # Check name
-        name_index = model.index(source_row, AssetTableModel.COL_NAME, source_parent)
-        name = model.data(name_index, Qt.ItemDataRole.DisplayRole)
-        if name and self._search_text in name.lower():
-            return True
-
-        # Check tags
-        tags_index = model.index(source_row, AssetTableModel.COL_TAGS, source_parent)
-        tags = model.data(tags_index, Qt.ItemDataRole.DisplayRole)
-        if tags and self._search_text in tags.lower():
-            return True
-
-        return False
+        # Name/tags are pre-lowercased in the source model
+        return model.matches_search(source_row, self._search_text)
 
     def lessThan(self, left: QModelIndex, right: QModelIndex) -> bool:
         """Custom sorting for rating column."""
@@ -66,6 +66,8 @@ class CustomCommandsManager:
 
     def __init__(self):
         self._commands: list[CustomCommand] = []
+        # Upper-cased shortcut -> commands bound to it, in order (None = rebuild)
+        self._by_shortcut: Optional[dict[str, list[CustomCommand]]] = None
         self._config_path = self._get_config_path()
         self._load()
 
@@ -100,6 +102,8 @@ class CustomCommandsManager:
 
     def _save(self) -> None:
         """Save commands to config file."""
+        # Every change to the command list is saved - drop the shortcut index here
+        self._by_shortcut = None
         with open(self._config_path, "w", encoding="utf-8") as f:
             json.dump([asdict(cmd) for cmd in self._commands], f, indent=2, ensure_ascii=False)
 
@@ -260,6 +264,20 @@ class CustomCommandsManager:
         """Get commands that match the given path."""
         return [cmd for cmd in self._commands if cmd.matches(path)]
 
+    def get_command_for_shortcut(self, path: Path, shortcut: str) -> Optional[CustomCommand]:
+        """Get the first command bound to shortcut (upper case) that matches the given path."""
+        if self._by_shortcut is None:
+            index: dict[str, list[CustomCommand]] = {}
+            for cmd in self._commands:
+                if cmd.shortcut:
+                    index.setdefault(cmd.shortcut.upper(), []).append(cmd)
+            self._by_shortcut = index
+
+        for cmd in self._by_shortcut.get(shortcut, ()):
+            if cmd.matches(path):
+                return cmd
+        return None
+
     def add_command(self, command: CustomCommand) -> None:
         """Add a new command."""
         self._commands.append(command)
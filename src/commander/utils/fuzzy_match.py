@@ -0,0 +1,133 @@
+"""Fuzzy filename matching used by file list type-to-search."""
+
+from __future__ import annotations
+
+try:
+    import numpy as np
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def fuzzy_score(pattern: str, text: str) -> int:
+    """Calculate fuzzy match score. Higher is better, 0 means no match."""
+    lp = len(pattern)
+    lt = len(text)
+    if not lp or lp > lt:
+        return 0
+
+    # Exact prefix match gets highest score
+    if text.startswith(pattern):
+        return 1000 + lp
+
+    # Check if all characters appear in order (earliest occurrence of each)
+    score = 0
+    consecutive = 0
+    last = -1
+
+    for char in pattern:
+        pos = text.find(char, last + 1)
+        if pos < 0:
+            return 0
+        # Bonus for consecutive matches
+        consecutive = consecutive + 1 if pos == last + 1 else 1
+        score += consecutive * 10
+        # Bonus for match at start
+        if pos == 0:
+            score += 50
+        last = pos
+
+    return score
+
+
+def _jit(func):
+    """Compile func with numba, caching the machine code on disk where possible."""
+    try:
+        return njit(cache=True)(func)
+    except RuntimeError:
+        # No cache locator (frozen or read-only install) - compile on first use instead
+        return njit(func)
+
+
+if HAS_NUMBA:
+
+    @_jit
+    def _score_rows(buf, offsets, rows, pattern, out):
+        """fuzzy_score() over packed names; same rules, one compiled loop."""
+        plen = pattern.shape[0]
+        for k in range(rows.shape[0]):
+            start = offsets[rows[k]]
+            tlen = offsets[rows[k] + 1] - start
+            out[k] = 0
+            if tlen < plen:
+                continue
+
+            # Exact prefix match
+            is_prefix = True
+            for j in range(plen):
+                if buf[start + j] != pattern[j]:
+                    is_prefix = False
+                    break
+            if is_prefix:
+                out[k] = 1000 + plen
+                continue
+
+            # Characters in order, with consecutive/start bonuses
+            pattern_idx = 0
+            score = 0
+            consecutive = 0
+            for i in range(tlen):
+                if tlen - i < plen - pattern_idx:
+                    break
+                if buf[start + i] == pattern[pattern_idx]:
+                    pattern_idx += 1
+                    consecutive += 1
+                    score += consecutive * 10
+                    if i == 0:
+                        score += 50
+                    if pattern_idx == plen:
+                        out[k] = score
+                        break
+                else:
+                    consecutive = 0
+
+
+def _encode(text: str):
+    """Encode text as an array of code points."""
+    return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+
+
+class PackedNames:
+    """Names stored as one code point array plus offsets, for compiled scoring.
+
+    Requires numba (and numpy); check HAS_NUMBA first.
+    """
+
+    def __init__(self, names: list[str]):
+        self._buf = _encode("".join(names))
+        self._offsets = np.zeros(len(names) + 1, dtype=np.int64)
+        np.cumsum([len(name) for name in names], out=self._offsets[1:])
+
+    def score_rows(self, pattern: str, rows: list[int]):
+        """Return fuzzy_score(pattern, names[row]) for each row as an int64 array."""
+        rows_arr = np.asarray(rows, dtype=np.int64)
+        out = np.empty(len(rows_arr), dtype=np.int64)
+        if pattern:
+            _score_rows(self._buf, self._offsets, rows_arr, _encode(pattern), out)
+        else:
+            out.fill(0)
+        return out
+
+    def best_match(self, pattern: str, rows: list[int]) -> tuple[int | None, list[int]]:
+        """Return (best scoring row or None, rows with a non-zero score).
+
+        Ties go to the first row in rows order, like a plain max loop.
+        """
+        rows_arr = np.asarray(rows, dtype=np.int64)
+        scores = self.score_rows(pattern, rows_arr)
+        hits = rows_arr[scores > 0]
+        if not hits.size:
+            return None, []
+        return int(rows_arr[scores.argmax()]), hits.tolist()
@@ -1,5 +1,8 @@
 """Application settings management."""
 
+import json
+import sys
+import uuid
 from pathlib import Path
 
 from PySide6.QtCore import QSettings
@@ -85,8 +88,6 @@ class Settings:
 
     def _get_default_favorites(self) -> list[Path]:
         """Get default favorite folders."""
-        import sys
-
         defaults = []
 
         home = Path.home()
@@ -306,8 +307,6 @@ class Settings:
         Returns:
             Generated connection ID.
         """
-        import uuid
-
         connections = self.load_network_connections()
 
         # Generate unique connection ID
@@ -380,7 +379,6 @@ class Settings:
     # Session management (tabs and windows)
     def save_session(self, windows: list[dict]):
         """Save complete session state (all windows and tabs)."""
-        import json
         self._settings.setValue("session/windows", json.dumps(windows))
 
     def load_session(self) -> list[dict]:
@@ -389,7 +387,6 @@ class Settings:
         Returns:
             List of window data dictionaries, or empty list if no session.
         """
-        import json
         data = self._settings.value("session/windows")
         if data:
             try:
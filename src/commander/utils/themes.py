@@ -1,5 +1,6 @@
 """Theme system for file type colors."""
 
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -341,6 +342,8 @@ class ThemeManager:
     def __init__(self):
         self._settings = Settings()
         self._current_theme: ColorTheme | None = None
+        # Lowercased suffix -> color for the current theme (filled on demand)
+        self._suffix_colors: dict[str, str | None] = {}
 
     @classmethod
     def instance(cls) -> "ThemeManager":
@@ -353,6 +356,7 @@ class ThemeManager:
         if self._current_theme is None:
             theme_name = self._settings.load_color_theme()
             self._current_theme = THEMES.get(theme_name, THEMES[DEFAULT_THEME])
+            self._suffix_colors.clear()
         return self._current_theme
 
     def set_theme(self, theme_name: str) -> None:
@@ -360,6 +364,7 @@ class ThemeManager:
         if theme_name in THEMES:
             self._settings.save_color_theme(theme_name)
             self._current_theme = THEMES[theme_name]
+            self._suffix_colors.clear()
 
     def get_available_themes(self) -> list[ColorTheme]:
         """Get list of available themes."""
@@ -367,27 +372,35 @@ class ThemeManager:
 
     def get_file_color(self, path: Path) -> str | None:
         """Get color for file based on current theme."""
+        return self.get_name_color(path.name, path.is_dir())
+
+    def get_name_color(self, name: str, is_dir: bool) -> str | None:
+        """Get color for a file name, when the caller already knows if it is a dir."""
         theme = self.get_current_theme()
 
         if not theme.colors:
             return None  # No colors theme
 
-        if path.is_dir():
+        if is_dir:
             return theme.colors.get("directory")
 
-        name = path.name
-        suffix = path.suffix.lower()
-
         # Check special filenames first
         if name in theme.special_files:
             return theme.colors.get("special")
 
         # Check by extension
+        suffix = os.path.splitext(name)[1].lower()
+        try:
+            return self._suffix_colors[suffix]
+        except KeyError:
+            pass
+        color = None  # Default color
         for file_type, extensions in theme.extensions.items():
             if suffix in extensions:
-                return theme.colors.get(file_type)
-
-        return None  # Default color
+                color = theme.colors.get(file_type)
+                break
+        self._suffix_colors[suffix] = color
+        return color
 
 
 def get_theme_manager() -> ThemeManager:
@@ -27,6 +27,7 @@ class ArchiveBrowser(QDialog):
     """Browser for archive contents."""
 
     IMAGE_EXTENSIONS = ALL_IMAGE_FORMATS
+    SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
 
     def __init__(self, archive_path: Path, parent=None):
         super().__init__(parent)
@@ -199,11 +200,9 @@ class ArchiveBrowser(QDialog):
 
     def _format_size(self, size: int) -> str:
         """Format file size."""
-        for unit in ["B", "KB", "MB", "GB"]:
-            if size < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
-        return f"{size:.1f} TB"
+        # Pick the unit from the bit length (each unit is 2**10) - one division, no loop
+        i = min(max(int(size).bit_length() - 1, 0) // 10, len(self.SIZE_UNITS) - 1)
+        return f"{size / (1 << (10 * i)):.1f} {self.SIZE_UNITS[i]}"
 
     def closeEvent(self, event):
         """Clean up on close."""
@@ -1,8 +1,10 @@
 """Asset browser view for displaying library assets."""
 
+import sys
+from pathlib import Path
 from typing import Optional, List
 
-from PySide6.QtCore import Qt, Signal, QSize, QModelIndex
+from PySide6.QtCore import Qt, Signal, QSize, QModelIndex, QTimer, QProcess
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -17,11 +19,15 @@ from PySide6.QtWidgets import (
     QAbstractItemView,
     QHeaderView,
 )
+from PySide6.QtGui import QAction
 
 from ..models.asset_model import AssetTableModel, AssetFilterProxyModel
 from ..core.asset_manager import Asset, get_library_manager, get_tag_manager
 from ..views.asset_thumbnail_delegate import AssetThumbnailDelegate
 
+# Platform opener for files and folders (explorer also opens files with their default app)
+_OPENER = {"darwin": "open", "win32": "explorer"}.get(sys.platform, "xdg-open")
+
 
 class AssetBrowserView(QWidget):
     """Browser view for displaying and interacting with library assets.
@@ -40,11 +46,23 @@ class AssetBrowserView(QWidget):
     VIEW_LIST = "list"
     VIEW_GRID = "grid"
 
+    # Delay before applying search text, so fast typing filters only once
+    SEARCH_DELAY_MS = 250
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._library_id: Optional[int] = None
         self._current_view_mode = self.VIEW_GRID
         self._tag_filter: List[int] = []
+        self._last_sel_cache: tuple[tuple, List[int]] | None = None
+
+        # Debounce search filtering
+        self._pending_search = ""
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DELAY_MS)
+        self._search_timer.timeout.connect(self._apply_search)
+
         self._setup_ui()
         self._setup_models()
 
@@ -84,6 +102,9 @@ class AssetBrowserView(QWidget):
         self._grid_view.setIconSize(QSize(128, 128))
         self._grid_view.setGridSize(QSize(150, 170))
         self._grid_view.setUniformItemSizes(True)
+        # Lay out large libraries in chunks so the UI stays responsive on reload
+        self._grid_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self._grid_view.setBatchSize(256)
         self._grid_view.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self._grid_view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self._grid_view.customContextMenuRequested.connect(self._show_context_menu)
@@ -112,6 +133,11 @@ class AssetBrowserView(QWidget):
         header.setStretchLastSection(True)
         header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
 
+        # Fixed row height - no per-row size hint queries while scrolling
+        row_header = self._list_view.verticalHeader()
+        row_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        row_header.setDefaultSectionSize(self._list_view.fontMetrics().height() + 6)
+
         self._stack.addWidget(self._list_view)
 
         layout.addWidget(self._stack)
@@ -136,6 +162,12 @@ class AssetBrowserView(QWidget):
 
         self._list_view.setModel(self._proxy_model)
 
+        # Proxy rows are remapped on reset/sort/filter - drop cached selection
+        self._proxy_model.modelReset.connect(self._invalidate_selection_cache)
+        self._proxy_model.layoutChanged.connect(self._invalidate_selection_cache)
+        self._proxy_model.rowsInserted.connect(self._invalidate_selection_cache)
+        self._proxy_model.rowsRemoved.connect(self._invalidate_selection_cache)
+
         # Connect selection changes
         self._grid_view.selectionModel().selectionChanged.connect(self._on_selection_changed)
         self._list_view.selectionModel().selectionChanged.connect(self._on_selection_changed)
@@ -159,8 +191,13 @@ class AssetBrowserView(QWidget):
         self._update_status()
 
     def _on_search_changed(self, text: str) -> None:
-        """Handle search text change."""
-        self._proxy_model.set_search_text(text)
+        """Handle search text change (debounced)."""
+        self._pending_search = text
+        self._search_timer.start()
+
+    def _apply_search(self) -> None:
+        """Apply pending search text to the filter."""
+        self._proxy_model.set_search_text(self._pending_search)
         self._update_status()
 
     def _on_view_mode_changed(self, index: int) -> None:
@@ -195,17 +232,37 @@ class AssetBrowserView(QWidget):
             self._grid_view if self._current_view_mode == self.VIEW_GRID else self._list_view
         )
 
-        selection = current_view.selectionModel().selectedIndexes()
-        asset_ids = set()
+        # Walk selection ranges row-wise: one entry per row instead of one per cell.
+        # (selectedRows() can't be used - the grid view only selects column 0.)
+        rows = tuple(
+            sorted(
+                {
+                    row
+                    for selection_range in current_view.selectionModel().selection()
+                    for row in range(selection_range.top(), selection_range.bottom() + 1)
+                }
+            )
+        )
+
+        # Qt often fires selectionChanged repeatedly for the same logical selection
+        key = (self._current_view_mode, rows)
+        if self._last_sel_cache is not None and self._last_sel_cache[0] == key:
+            return list(self._last_sel_cache[1])
 
-        for index in selection:
-            source_index = self._proxy_model.mapToSource(index)
+        asset_ids = []
+        for row in rows:
+            source_index = self._proxy_model.mapToSource(self._proxy_model.index(row, 0))
             asset = self._model.get_asset(source_index.row())
             if asset:
-                asset_ids.add(asset.id)
+                asset_ids.append(asset.id)
 
+        self._last_sel_cache = (key, asset_ids)
         return list(asset_ids)
 
+    def _invalidate_selection_cache(self) -> None:
+        """Forget cached selection (proxy rows no longer map to the same assets)."""
+        self._last_sel_cache = None
+
     def _show_context_menu(self, pos) -> None:
         """Show context menu for assets."""
         current_view = (
@@ -221,112 +278,156 @@ class AssetBrowserView(QWidget):
         if not asset:
             return
 
+        # Tag/rating actions apply to the whole selection when the clicked asset is in it
+        target_ids = tuple(a.id for a in self._get_action_targets(asset))
+
+        # Actions carry (kind, asset_ids, value) and are handled by one dispatcher.
+        # QMenu.triggered also fires for actions in submenus, so one connection covers all.
         menu = QMenu(self)
+        menu.triggered.connect(self._on_menu_action)
 
         # Open action
-        open_action = menu.addAction("Open")
-        open_action.triggered.connect(lambda: self._open_asset(asset))
+        menu.addAction("Open").setData(("open", (asset.id,), None))
 
         # Open folder action
         if asset.current_path:
-            folder_action = menu.addAction("Open Folder")
-            folder_action.triggered.connect(lambda: self._open_folder(asset))
+            menu.addAction("Open Folder").setData(("open_folder", (asset.id,), None))
 
         menu.addSeparator()
 
-        # Tag submenu
-        tag_menu = menu.addMenu("Add Tag")
-        self._populate_tag_menu(tag_menu, asset)
+        # Submenus are filled on first show - most right-clicks never open them
+        self._add_lazy_submenu(
+            menu, "Add Tag", lambda m: self._populate_tag_menu(m, asset, target_ids)
+        )
 
-        # Remove tag submenu
         if asset.tags:
-            remove_tag_menu = menu.addMenu("Remove Tag")
-            for tag_str in asset.tags:
-                action = remove_tag_menu.addAction(tag_str)
-                action.triggered.connect(lambda checked, t=tag_str: self._remove_tag(asset, t))
+            self._add_lazy_submenu(
+                menu, "Remove Tag", lambda m: self._populate_remove_tag_menu(m, asset, target_ids)
+            )
 
         menu.addSeparator()
 
-        # Rating submenu
-        rating_menu = menu.addMenu("Rating")
+        self._add_lazy_submenu(
+            menu, "Rating", lambda m: self._populate_rating_menu(m, asset, target_ids)
+        )
+
+        menu.exec(current_view.mapToGlobal(pos))
+
+    def _get_action_targets(self, asset: Asset) -> List[Asset]:
+        """Get assets a context menu action applies to."""
+        selected = self.get_selected_assets()
+        if any(a.id == asset.id for a in selected):
+            return selected
+        return [asset]
+
+    def _add_lazy_submenu(self, menu: QMenu, title: str, populate) -> QMenu:
+        """Add a submenu that is populated the first time it is shown."""
+        submenu = menu.addMenu(title)
+
+        def on_about_to_show():
+            if not submenu.property("populated"):
+                submenu.setProperty("populated", True)
+                populate(submenu)
+
+        submenu.aboutToShow.connect(on_about_to_show)
+        return submenu
+
+    def _populate_remove_tag_menu(
+        self, menu: QMenu, asset: Asset, target_ids: tuple[int, ...]
+    ) -> None:
+        """Populate remove-tag menu with the asset's tags."""
+        for tag_str in asset.tags:
+            menu.addAction(tag_str).setData(("remove_tag", target_ids, tag_str))
+
+    def _populate_rating_menu(self, menu: QMenu, asset: Asset, target_ids: tuple[int, ...]) -> None:
+        """Populate rating menu."""
         for i in range(6):
             stars = "★" * i if i > 0 else "No Rating"
-            action = rating_menu.addAction(stars)
-            action.triggered.connect(lambda checked, r=i: self._set_rating(asset, r))
+            action = menu.addAction(stars)
+            action.setData(("rating", target_ids, i))
             if asset.rating == i:
                 action.setCheckable(True)
                 action.setChecked(True)
 
-        menu.exec(current_view.mapToGlobal(pos))
-
-    def _populate_tag_menu(self, menu: QMenu, asset: Asset) -> None:
+    def _populate_tag_menu(self, menu: QMenu, asset: Asset, target_ids: tuple[int, ...]) -> None:
         """Populate tag menu with available tags."""
         if self._library_id is None:
             return
 
-        tag_manager = get_tag_manager()
-        tags = tag_manager.get_library_tags(self._library_id)
+        # Cached by the tag manager until asset tags change anywhere
+        tags = get_tag_manager().get_library_tags(self._library_id)
 
         # Filter out already-applied tags
         existing_tags = set(asset.tags)
 
         for tag in tags[:20]:  # Limit to 20 tags
             if tag.full_name not in existing_tags:
-                action = menu.addAction(tag.full_name)
-                action.triggered.connect(lambda checked, t=tag: self._add_tag(asset, t))
+                menu.addAction(tag.full_name).setData(("add_tag", target_ids, tag))
 
         if not tags:
             menu.addAction("(No tags available)").setEnabled(False)
 
+    def _on_menu_action(self, action: QAction) -> None:
+        """Dispatch a context menu action from its data."""
+        data = action.data()
+        if not data:
+            return
+
+        kind, asset_ids, value = data
+        assets = [a for a in map(self._model.get_asset_by_id, asset_ids) if a]
+        if not assets:
+            return
+
+        if kind == "open":
+            self._open_asset(assets[0])
+        elif kind == "open_folder":
+            self._open_folder(assets[0])
+        elif kind == "add_tag":
+            self._add_tag(assets, value)
+        elif kind == "remove_tag":
+            self._remove_tag(assets, value)
+        elif kind == "rating":
+            self._set_rating(assets, value)
+
     def _open_asset(self, asset: Asset) -> None:
         """Open asset file."""
         if asset.current_path and asset.current_path.exists():
-            import subprocess
-            import sys
-
-            if sys.platform == "darwin":
-                subprocess.run(["open", str(asset.current_path)])
-            elif sys.platform == "win32":
-                subprocess.run(["start", "", str(asset.current_path)], shell=True)
-            else:
-                subprocess.run(["xdg-open", str(asset.current_path)])
+            self._launch(asset.current_path)
 
     def _open_folder(self, asset: Asset) -> None:
         """Open containing folder."""
         if asset.current_path and asset.current_path.exists():
-            import subprocess
-            import sys
-
-            folder = asset.current_path.parent
-            if sys.platform == "darwin":
-                subprocess.run(["open", str(folder)])
-            elif sys.platform == "win32":
-                subprocess.run(["explorer", str(folder)])
-            else:
-                subprocess.run(["xdg-open", str(folder)])
-
-    def _add_tag(self, asset: Asset, tag) -> None:
-        """Add tag to asset."""
+            self._launch(asset.current_path.parent)
+
+    def _launch(self, path: Path) -> None:
+        """Open path with the platform opener without blocking the UI."""
+        QProcess.startDetached(_OPENER, [str(path)])
+
+    def _add_tag(self, assets: List[Asset], tag) -> None:
+        """Add tag to assets."""
         lib_manager = get_library_manager()
-        lib_manager.add_tag_to_asset(asset.id, tag.id)
-        self._model.update_asset(asset.id)
+        for asset in assets:
+            lib_manager.add_tag_to_asset(asset.id, tag.id)
+        self._model.update_assets([asset.id for asset in assets])
 
-    def _remove_tag(self, asset: Asset, tag_str: str) -> None:
-        """Remove tag from asset."""
+    def _remove_tag(self, assets: List[Asset], tag_str: str) -> None:
+        """Remove tag from assets."""
         tag_manager = get_tag_manager()
         namespace, name = tag_manager.parse_tag_string(tag_str)
         tag = tag_manager.get_tag_by_name(name, namespace)
 
         if tag:
             lib_manager = get_library_manager()
-            lib_manager.remove_tag_from_asset(asset.id, tag.id)
-            self._model.update_asset(asset.id)
+            for asset in assets:
+                lib_manager.remove_tag_from_asset(asset.id, tag.id)
+            self._model.update_assets([asset.id for asset in assets])
 
-    def _set_rating(self, asset: Asset, rating: int) -> None:
-        """Set asset rating."""
+    def _set_rating(self, assets: List[Asset], rating: int) -> None:
+        """Set rating on assets."""
         lib_manager = get_library_manager()
-        lib_manager.update_asset(asset.id, rating=rating)
-        self._model.update_asset(asset.id)
+        for asset in assets:
+            lib_manager.update_asset(asset.id, rating=rating)
+        self._model.update_assets([asset.id for asset in assets])
 
     def _update_status(self) -> None:
         """Update status bar."""
@@ -356,6 +457,8 @@ class AssetBrowserView(QWidget):
 
         source_index = self._model.index(row, 0)
         proxy_index = self._proxy_model.mapFromSource(source_index)
+        if not proxy_index.isValid():
+            return  # Filtered out by search
 
         current_view = (
             self._grid_view if self._current_view_mode == self.VIEW_GRID else self._list_view
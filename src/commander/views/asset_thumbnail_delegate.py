@@ -1,17 +1,36 @@
 """Thumbnail delegate for asset browser with lazy loading.
 
-Only loads thumbnails for items currently visible in the viewport.
+Only loads thumbnails for items currently visible in the viewport, plus a
+small buffer of rows above/below so scrolling doesn't pop in.
 Uses an LRU cache to manage memory efficiently.
 """
 
 from pathlib import Path
 
-from PySide6.QtCore import Qt, QModelIndex, QSize, QRect
-from PySide6.QtGui import QPixmap, QPainter, QColor, QPen
-from PySide6.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem, QAbstractItemView
+from PySide6.QtCore import (
+    Qt,
+    QModelIndex,
+    QPersistentModelIndex,
+    QSize,
+    QRect,
+    QTimer,
+    QPoint,
+)
+from PySide6.QtGui import QPixmap, QPainter, QColor, QPen, QFont
+from PySide6.QtWidgets import (
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QAbstractItemView,
+    QListView,
+)
 
 from commander.core.thumbnail_provider import get_thumbnail_provider
 
+# Plain int masks so paint() tests option.state without enum lookups
+_STATE_SELECTED = QStyle.StateFlag.State_Selected.value
+_STATE_MOUSE_OVER = QStyle.StateFlag.State_MouseOver.value
+
 
 class AssetThumbnailDelegate(QStyledItemDelegate):
     """Delegate for rendering asset thumbnails with lazy loading.
@@ -26,27 +45,76 @@ class AssetThumbnailDelegate(QStyledItemDelegate):
     # Path role in the model (UserRole + 2 in AssetTableModel)
     PATH_ROLE = Qt.ItemDataRole.UserRole + 2
 
+    # Minimum interval between viewport repaints (~one frame)
+    UPDATE_INTERVAL_MS = 16
+
+    # Max cached elided filenames before the cache is reset
+    ELIDE_CACHE_SIZE = 4096
+
+    # Rows above/below the viewport whose thumbnails are requested ahead of time
+    PREFETCH_ROWS = 2
+
+    # Placeholder text -> text color (loading image / not an image)
+    PLACEHOLDER_COLORS = {"...": QColor(120, 120, 120), "N/A": QColor(100, 100, 100)}
+
     def __init__(self, parent: QAbstractItemView = None):
         super().__init__(parent)
         self._view = parent
         self._thumbnail_size = QSize(128, 128)
         self._item_size = QSize(150, 170)
+        self._update_layout()
+
+        # Rendered placeholders: (text, device pixel ratio) -> pixmap at thumbnail size
+        self._placeholders: dict[tuple[str, float], QPixmap] = {}
+
+        # Elided filename cache: (name, width) -> text, valid for _elide_font only
+        self._elide_cache: dict[tuple[str, int], str] = {}
+        self._elide_font: QFont | None = None
 
         # Connect to thumbnail provider
         self._provider = get_thumbnail_provider()
         self._provider.thumbnail_ready.connect(self._on_thumbnail_ready)
 
-        # Track which paths are visible (for efficient updates)
-        self._visible_paths: set[str] = set()
+        # Track which paths are visible and the cells showing them (for targeted updates)
+        self._visible_paths: dict[Path, list[QPersistentModelIndex]] = {}
+        self._pending_updates: list[QPersistentModelIndex] = []
+        if self._view is not None:
+            # Drop stale entries on scroll; paint re-adds whatever is on screen
+            self._view.verticalScrollBar().valueChanged.connect(self.clear_visible_paths)
+            self._view.verticalScrollBar().valueChanged.connect(self._prefetch_visible)
+
+        # Coalesce bursts of thumbnail_ready into one update pass per frame
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(self.UPDATE_INTERVAL_MS)
+        self._update_timer.timeout.connect(self._flush_update)
 
     def set_thumbnail_size(self, size: QSize) -> None:
         """Set thumbnail size."""
         self._thumbnail_size = size
         self._provider.set_thumbnail_size(size)
+        self._update_layout()
+        self._placeholders.clear()
 
     def set_item_size(self, size: QSize) -> None:
         """Set total item size including label."""
         self._item_size = size
+        self._update_layout()
+        self._elide_cache.clear()
+
+    def _update_layout(self) -> None:
+        """Precompute thumbnail/text geometry relative to the cell origin.
+
+        Every cell has the same size, so only the origin changes between paints.
+        """
+        self._thumb_w = self._thumbnail_size.width()
+        self._thumb_h = self._thumbnail_size.height()
+        self._thumb_dx = (self._item_size.width() - self._thumb_w) // 2
+        self._thumb_dy = 4
+        self._text_dx = 4
+        self._text_dy = self._thumb_dy + self._thumb_h + 3  # 4px below thumbnail bottom
+        self._text_w = self._item_size.width() - 8
+        self._text_h = self._item_size.height() - self._thumb_h - 12
 
     def sizeHint(
         self, option: QStyleOptionViewItem, index: QModelIndex
@@ -58,37 +126,39 @@ class AssetThumbnailDelegate(QStyledItemDelegate):
         self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex
     ) -> None:
         """Paint the item with thumbnail and filename."""
+        # Skip cells that are entirely clipped away (e.g. during fast scrolling)
+        if option.rect.isEmpty() or (
+            painter.hasClipping() and not painter.clipRegion().intersects(option.rect)
+        ):
+            return
+
         painter.save()
 
+        state = option.state.value
+        is_selected = bool(state & _STATE_SELECTED)
+        is_hovered = bool(state & _STATE_MOUSE_OVER)
+
         # Get item data
         path = index.data(self.PATH_ROLE)
         name = index.data(Qt.ItemDataRole.DisplayRole) or ""
 
         # Calculate rects
         rect = option.rect
-        thumb_rect = QRect(
-            rect.x() + (rect.width() - self._thumbnail_size.width()) // 2,
-            rect.y() + 4,
-            self._thumbnail_size.width(),
-            self._thumbnail_size.height(),
-        )
-        text_rect = QRect(
-            rect.x() + 4,
-            thumb_rect.bottom() + 4,
-            rect.width() - 8,
-            rect.height() - thumb_rect.height() - 12,
-        )
+        x = rect.x()
+        y = rect.y()
+        thumb_rect = QRect(x + self._thumb_dx, y + self._thumb_dy, self._thumb_w, self._thumb_h)
+        text_rect = QRect(x + self._text_dx, y + self._text_dy, self._text_w, self._text_h)
 
         # Draw selection background
-        if option.state & QStyleOptionViewItem.State_Selected:
+        if is_selected:
             painter.fillRect(rect, option.palette.highlight())
-        elif option.state & QStyleOptionViewItem.State_MouseOver:
+        elif is_hovered:
             hover_color = option.palette.highlight().color()
             hover_color.setAlpha(50)
             painter.fillRect(rect, hover_color)
 
         # Draw thumbnail
-        pixmap = self._get_thumbnail(path)
+        pixmap = self._get_thumbnail(path, index)
         if pixmap and not pixmap.isNull():
             # Center the pixmap in thumb_rect
             px = thumb_rect.x() + (thumb_rect.width() - pixmap.width()) // 2
@@ -99,69 +169,131 @@ class AssetThumbnailDelegate(QStyledItemDelegate):
             self._draw_placeholder(painter, thumb_rect, path)
 
         # Draw filename
-        if option.state & QStyleOptionViewItem.State_Selected:
+        if is_selected:
             painter.setPen(option.palette.highlightedText().color())
         else:
             painter.setPen(option.palette.text().color())
 
         # Elide text if too long
-        font_metrics = painter.fontMetrics()
-        elided_text = font_metrics.elidedText(
-            name, Qt.TextElideMode.ElideMiddle, text_rect.width()
-        )
+        elided_text = self._elide(painter, name, text_rect.width())
         painter.drawText(text_rect, Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop, elided_text)
 
         painter.restore()
 
-    def _get_thumbnail(self, path: Path | None) -> QPixmap | None:
+    def _elide(self, painter: QPainter, name: str, width: int) -> str:
+        """Elide filename to width, memoized per font."""
+        font = painter.font()
+        if font != self._elide_font:
+            self._elide_font = QFont(font)
+            self._elide_cache.clear()
+
+        key = (name, width)
+        elided = self._elide_cache.get(key)
+        if elided is None:
+            if len(self._elide_cache) >= self.ELIDE_CACHE_SIZE:
+                self._elide_cache.clear()
+            elided = painter.fontMetrics().elidedText(name, Qt.TextElideMode.ElideMiddle, width)
+            self._elide_cache[key] = elided
+        return elided
+
+    def _get_thumbnail(self, path: Path | None, index: QModelIndex) -> QPixmap | None:
         """Get thumbnail for path, triggering load if needed."""
         if path is None or not isinstance(path, Path):
             return None
 
-        # Track visible path
-        self._visible_paths.add(str(path))
+        # Track visible path and the cell showing it
+        indices = self._visible_paths.setdefault(path, [])
+        if not any(idx == index for idx in indices):
+            # Drop entries invalidated by a model reset before adding the new cell
+            indices[:] = [idx for idx in indices if idx.isValid()]
+            indices.append(QPersistentModelIndex(index))
 
         # Request thumbnail (will return None if loading)
         return self._provider.get_thumbnail(path)
 
-    def _draw_placeholder(
-        self, painter: QPainter, rect: QRect, path: Path | None
-    ) -> None:
-        """Draw placeholder while thumbnail is loading."""
-        # Draw background
-        painter.fillRect(rect, QColor(60, 60, 60))
+    def _render_placeholder(self, text: str, dpr: float) -> QPixmap:
+        """Render a placeholder pixmap with centered text, sharp at the given pixel ratio."""
+        pixmap = QPixmap(self._thumbnail_size * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(QColor(60, 60, 60))
+        rect = QRect(QPoint(0, 0), self._thumbnail_size)
+
+        painter = QPainter(pixmap)
+        if self._view is not None:
+            painter.setFont(self._view.font())
 
         # Draw border
         painter.setPen(QPen(QColor(80, 80, 80), 1))
         painter.drawRect(rect.adjusted(0, 0, -1, -1))
 
-        # Draw loading indicator or icon based on file type
-        if path and self._provider.is_supported(path):
-            # Loading indicator
-            painter.setPen(QColor(120, 120, 120))
-            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, "...")
-        else:
-            # Not an image
-            painter.setPen(QColor(100, 100, 100))
-            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, "N/A")
+        painter.setPen(self.PLACEHOLDER_COLORS[text])
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+        painter.end()
+        return pixmap
+
+    def _draw_placeholder(self, painter: QPainter, rect: QRect, path: Path | None) -> None:
+        """Draw placeholder while thumbnail is loading."""
+        # Loading indicator for images, "N/A" for other file types
+        text = "..." if path and self._provider.is_supported(path) else "N/A"
+        dpr = painter.device().devicePixelRatioF()
+        key = (text, dpr)
+        pixmap = self._placeholders.get(key)
+        if pixmap is None:
+            pixmap = self._render_placeholder(text, dpr)
+            self._placeholders[key] = pixmap
+        painter.drawPixmap(rect.topLeft(), pixmap)
 
     def _on_thumbnail_ready(self, path_str: str) -> None:
         """Handle thumbnail ready signal - update the view."""
         if self._view is None:
             return
 
-        # Only update if this path is currently visible
-        if path_str not in self._visible_paths:
+        # Only update if this path is currently visible; repainting re-registers it
+        indices = self._visible_paths.pop(Path(path_str), None)
+        if not indices:
+            return
+
+        # Schedule repaint of just the cells showing this path
+        self._pending_updates.extend(indices)
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+
+    def _flush_update(self) -> None:
+        """Repaint the cells whose thumbnails arrived since the last flush."""
+        pending, self._pending_updates = self._pending_updates, []
+        if self._view is None:
             return
+        for idx in pending:
+            if idx.isValid():
+                self._view.update(QModelIndex(idx))
 
-        # Find and update the item with this path
-        # The view will only repaint visible items
-        model = self._view.model()
-        if model is None:
+    def _prefetch_visible(self) -> None:
+        """Request thumbnails for the viewport plus a buffer of rows around it."""
+        if self._view is None or self._view.model() is None:
             return
 
-        # Schedule viewport update - Qt will only repaint visible items
-        self._view.viewport().update()
+        step = self._item_size
+        if isinstance(self._view, QListView) and self._view.gridSize().isValid():
+            step = self._view.gridSize()
+        step_w = max(step.width(), 1)
+        step_h = max(step.height(), 1)
+
+        viewport = self._view.viewport().rect()
+        buffer = self.PREFETCH_ROWS * step_h
+        visible_ys = range(step_h // 2, viewport.height(), step_h)
+        below_ys = range(visible_ys.stop, viewport.height() + buffer, step_h)
+        above_ys = range(step_h // 2 - step_h, step_h // 2 - buffer - 1, -step_h)
+
+        # Visible rows first so they aren't queued behind the buffer
+        for ys in (visible_ys, below_ys, above_ys):
+            for y in ys:
+                for x in range(step_w // 2, viewport.width(), step_w):
+                    index = self._view.indexAt(QPoint(x, y))
+                    if not index.isValid():
+                        continue
+                    path = index.data(self.PATH_ROLE)
+                    if isinstance(path, Path):
+                        self._provider.get_thumbnail(path)
 
     def clear_visible_paths(self) -> None:
         """Clear visible paths tracking (call on scroll/resize)."""
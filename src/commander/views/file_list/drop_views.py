@@ -3,72 +3,17 @@
 from pathlib import Path
 
 from PySide6.QtCore import Signal
-from PySide6.QtWidgets import QTreeView, QListView, QAbstractItemView
+from PySide6.QtWidgets import QTreeView, QListView
 from PySide6.QtGui import QDragEnterEvent, QDropEvent
 
 
 class DragDropMixin:
-    """Mixin class for drag and drop functionality.
+    """Mixin accepting file drops from external apps (e.g. Finder).
 
-    Provides:
-    - Drag out to external apps (files/folders)
-    - Drop from external apps
-    - Internal drag and drop
+    Mix in before the Qt view class; internal drags fall through to the view.
     """
 
-    files_dropped = Signal(list, Path)  # dropped files, destination
-    _current_path: Path | None = None
-
-    def setup_drag_drop(self) -> None:
-        """Setup drag and drop settings. Call this in __init__ after super()."""
-        self.setAcceptDrops(True)
-        self.setDragEnabled(True)
-        self.setDragDropMode(QAbstractItemView.DragDropMode.DragDrop)
-        self.setDefaultDropAction(Qt.DropAction.CopyAction)
-
-    def set_current_path(self, path: Path) -> None:
-        """Set current directory path for drops."""
-        self._current_path = path
-
-    def get_drag_paths(self) -> list[Path]:
-        """Get paths of selected items for dragging. Override in subclass."""
-        return []
-
-    def handle_drag_enter(self, event: QDragEnterEvent) -> bool:
-        """Handle drag enter. Returns True if handled."""
-        if event.mimeData().hasUrls():
-            event.acceptProposedAction()
-            return True
-        return False
-
-    def handle_drag_move(self, event) -> bool:
-        """Handle drag move. Returns True if handled."""
-        if event.mimeData().hasUrls():
-            event.acceptProposedAction()
-            return True
-        return False
-
-    def handle_drop(self, event: QDropEvent, dest_path: Path | None = None) -> bool:
-        """Handle drop. Returns True if handled."""
-        target = dest_path or self._current_path
-        if event.mimeData().hasUrls() and target:
-            urls = event.mimeData().urls()
-            paths = [Path(url.toLocalFile()) for url in urls if url.isLocalFile()]
-            if paths:
-                self.files_dropped.emit(paths, target)
-                event.acceptProposedAction()
-                return True
-        return False
-
-
-# Need to import Qt here to avoid circular import
-from PySide6.QtCore import Qt
-
-
-class DropEnabledTreeView(QTreeView):
-    """TreeView that handles drag and drop."""
-
-    files_dropped = Signal(list, Path)  # dropped files, destination
+    files_dropped = Signal(list, Path)  # dropped file paths (str), destination
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -97,7 +42,7 @@ class DropEnabledTreeView(QTreeView):
         """Handle drop - copy/move files from external apps."""
         if event.mimeData().hasUrls() and self._current_path:
             urls = event.mimeData().urls()
-            paths = [Path(url.toLocalFile()) for url in urls if url.isLocalFile()]
+            paths = [url.toLocalFile() for url in urls if url.isLocalFile()]
             if paths:
                 self.files_dropped.emit(paths, self._current_path)
                 event.acceptProposedAction()
@@ -105,41 +50,9 @@ class DropEnabledTreeView(QTreeView):
         super().dropEvent(event)
 
 
-class DropEnabledListView(QListView):
-    """ListView that handles drag and drop."""
-
-    files_dropped = Signal(list, Path)  # dropped files, destination
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setAcceptDrops(True)
-        self._current_path: Path | None = None
-
-    def set_current_path(self, path: Path) -> None:
-        """Set current directory path for drops."""
-        self._current_path = path
-
-    def dragEnterEvent(self, event: QDragEnterEvent) -> None:
-        """Handle drag enter - accept file drops from external apps."""
-        if event.mimeData().hasUrls():
-            event.acceptProposedAction()
-        else:
-            super().dragEnterEvent(event)
+class DropEnabledTreeView(DragDropMixin, QTreeView):
+    """TreeView that handles drag and drop."""
 
-    def dragMoveEvent(self, event) -> None:
-        """Handle drag move."""
-        if event.mimeData().hasUrls():
-            event.acceptProposedAction()
-        else:
-            super().dragMoveEvent(event)
 
-    def dropEvent(self, event: QDropEvent) -> None:
-        """Handle drop - copy/move files from external apps."""
-        if event.mimeData().hasUrls() and self._current_path:
-            urls = event.mimeData().urls()
-            paths = [Path(url.toLocalFile()) for url in urls if url.isLocalFile()]
-            if paths:
-                self.files_dropped.emit(paths, self._current_path)
-                event.acceptProposedAction()
-                return
-        super().dropEvent(event)
+class DropEnabledListView(DragDropMixin, QListView):
+    """ListView that handles drag and drop."""
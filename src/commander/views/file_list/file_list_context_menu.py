@@ -4,14 +4,26 @@ from __future__ import annotations
 
 import sys
 import subprocess
+from functools import partial
 from pathlib import Path
 
 from PySide6.QtCore import QPoint
+from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QMenu
 
 from commander.views.file_list.file_list_models import MenuShortcutFilter
+from commander.core.archive_handler import ArchiveManager
+from commander.utils.custom_commands import get_custom_commands_manager
 from commander.utils.i18n import tr
 
+_IS_MACOS = sys.platform == "darwin"
+_IS_WINDOWS = sys.platform == "win32"
+
+# Label of the "show in file manager" action for this platform
+_REVEAL_LABEL = {"darwin": "Reveal in Finder", "win32": "Open in Explorer"}.get(
+    sys.platform, "Open in File Manager"
+)
+
 
 class FileListContextMenuMixin:
     """Mixin providing context menu functionality."""
@@ -19,151 +31,159 @@ class FileListContextMenuMixin:
     # Expected from main class
     _current_path: Path | None
     _viewer: object
+    _model: object
 
-    def _show_context_menu(self, pos: QPoint) -> None:
-        """Show context menu with custom options."""
-        from commander.utils.custom_commands import get_custom_commands_manager
-
-        selected_paths = self.get_selected_paths()
-
-        # Target path: selected item or current folder (for empty space click)
-        target_path = selected_paths[0] if selected_paths else self._current_path
+    # Persistent context menu, built on first use and reused for every right-click
+    _ctx_menu: QMenu | None = None
 
+    def _build_context_menu(self) -> None:
+        """Create the context menu and its static actions once."""
         menu = QMenu(self)
+        actions: dict[str, QAction] = {}
 
-        # Open with default app
-        if selected_paths:
-            open_action = menu.addAction("Open")
-            open_action.triggered.connect(lambda: self._open_with_default(selected_paths[0]))
-
-            # Open in New Window (for folders)
-            if len(selected_paths) == 1 and selected_paths[0].is_dir():
-                new_window_action = menu.addAction("Open in New Window")
-                new_window_action.triggered.connect(
-                    lambda: self.request_new_window.emit(selected_paths[0])
-                )
-
-        # Custom commands - show for selected file OR current folder (empty space click)
-        shortcut_actions: dict[str, tuple] = {}  # shortcut -> (cmd, path)
-        if target_path and (len(selected_paths) <= 1):
-            custom_cmds = get_custom_commands_manager().get_commands_for_path(target_path)
-            if custom_cmds:
-                menu.addSeparator()
-                for cmd in custom_cmds:
-                    # Show shortcut in menu name like "Open in Image Viewer(3)"
-                    name = cmd.name
-                    if cmd.shortcut:
-                        name = f"{cmd.name}({cmd.shortcut})"
-                        shortcut_actions[cmd.shortcut.upper()] = (cmd, target_path)
-                    action = menu.addAction(name)
-                    action.triggered.connect(
-                        lambda checked, c=cmd, p=target_path: self._run_custom_command(c, p)
-                    )
-
-        if selected_paths:
-            # Open With submenu (macOS only for now)
-            if sys.platform == "darwin" and len(selected_paths) == 1:
-                open_with_menu = menu.addMenu("Open With")
-                self._populate_open_with_menu(open_with_menu, selected_paths[0])
-
-            if len(selected_paths) == 1:
-                menu.addSeparator()
-
-                # Rename (F2)
-                rename_action = menu.addAction("Rename")
-                rename_action.setShortcut("F2")
-                rename_action.triggered.connect(self.start_rename)
-
-                # Get Info
-                info_action = menu.addAction("Get Info")
-                info_action.triggered.connect(lambda: self._show_info(selected_paths[0]))
-
-            menu.addSeparator()
-
-            # Copy/Cut/Delete
-            copy_action = menu.addAction("Copy")
-            copy_action.triggered.connect(lambda: self._copy_files(selected_paths))
-
-            cut_action = menu.addAction("Cut")
-            cut_action.triggered.connect(lambda: self._cut_files(selected_paths))
-
-            # Copy Path
-            copy_path_action = menu.addAction("Copy Path")
-            copy_path_action.triggered.connect(lambda: self._copy_path(selected_paths))
+        def add(key: str, text: str, slot) -> None:
+            actions[key] = menu.addAction(text)
+            actions[key].triggered.connect(slot)
 
-            menu.addSeparator()
+        # Actions read the selection captured when the menu was opened
+        add("open", "Open", lambda: self._open_with_default(self._ctx_paths[0]))
+        add(
+            "new_window",
+            "Open in New Window",
+            lambda: self.request_new_window.emit(self._ctx_paths[0]),
+        )
 
-            delete_action = menu.addAction("Delete")
-            delete_action.triggered.connect(lambda: self._delete_files(selected_paths))
+        # Custom commands are inserted before this separator on every show
+        self._ctx_custom_anchor = menu.addSeparator()
 
-            menu.addSeparator()
+        # Open With submenu (macOS only for now), filled only when the user opens it
+        self._ctx_open_with = menu.addMenu("Open With")
+        self._ctx_open_with.aboutToShow.connect(self._fill_open_with_menu)
 
-            # Extract All option for archives
-            from commander.core.archive_handler import ArchiveManager
-
-            archive_paths = [p for p in selected_paths if ArchiveManager.is_archive(p)]
-            if archive_paths:
-                extract_action = menu.addAction(f"{tr('extract_all')}(Z)")
-                extract_action.triggered.connect(lambda: self._extract_archives(archive_paths))
-                shortcut_actions["Z"] = (None, archive_paths)  # Special marker for extract
+        menu.addSeparator()
+        add("rename", "Rename", self.start_rename)
+        actions["rename"].setShortcut("F2")
+        add("info", "Get Info", lambda: self._show_info(self._ctx_paths[0]))
 
-            # Compress option
-            if len(selected_paths) >= 1:
-                compress_action = menu.addAction("Compress to ZIP...")
-                compress_action.triggered.connect(lambda: self._compress_files(selected_paths))
+        menu.addSeparator()
+        add("copy", "Copy", lambda: self._copy_files(self._ctx_paths))
+        add("cut", "Cut", lambda: self._cut_files(self._ctx_paths))
+        add("copy_path", "Copy Path", lambda: self._copy_path(self._ctx_paths))
+        menu.addSeparator()
+        add("delete", "Delete", lambda: self._delete_files(self._ctx_paths))
+        menu.addSeparator()
 
-            # Quick Look (macOS)
-            if sys.platform == "darwin" and len(selected_paths) == 1:
-                quicklook_action = menu.addAction("Quick Look")
-                quicklook_action.triggered.connect(lambda: self._quick_look(selected_paths[0]))
+        # Extract All option for archives
+        add(
+            "extract", f"{tr('extract_all')}(Z)", lambda: self._extract_archives(self._ctx_archives)
+        )
+        add("compress", "Compress to ZIP...", lambda: self._compress_files(self._ctx_paths))
+        add("quick_look", "Quick Look", lambda: self._quick_look(self._ctx_paths[0]))
 
         menu.addSeparator()
+        add("paste", "Paste", self._paste_files)
+        menu.addSeparator()
+        add("new_folder", "New Folder", self._create_new_folder)
+        add("new_file", "New File", self._create_new_file)
+        menu.addSeparator()
+        add("reveal", _REVEAL_LABEL, lambda: self._reveal_in_finder(self._ctx_reveal_path))
+
+        # Custom command actions carry (cmd, path) as data; one slot runs them all
+        menu.triggered.connect(self._on_ctx_action_triggered)
+
+        # Key event filter for custom command shortcuts; the dict is refilled on every show
+        self._ctx_shortcuts: dict[str, tuple] = {}  # shortcut -> (cmd, path)
+        menu.installEventFilter(
+            MenuShortcutFilter(
+                menu,
+                self._ctx_shortcuts,
+                self._run_custom_command,
+                self._extract_archives,
+            )
+        )
 
-        # Paste (always available)
-        paste_action = menu.addAction("Paste")
-        paste_action.triggered.connect(self._paste_files)
+        self._ctx_menu = menu
+        self._ctx_actions = actions
+        self._ctx_custom_actions: list[QAction] = []
+        self._ctx_paths: list[Path] = []
+        self._ctx_archives: list[Path] = []
+        self._ctx_reveal_path: Path | None = None
 
-        menu.addSeparator()
+    def _show_context_menu(self, pos: QPoint) -> None:
+        """Show context menu with custom options."""
+        if self._ctx_menu is None:
+            self._build_context_menu()
+        menu = self._ctx_menu
+        actions = self._ctx_actions
 
-        # New folder
-        new_folder_action = menu.addAction("New Folder")
-        new_folder_action.triggered.connect(self._create_new_folder)
+        selected_paths = self.get_selected_paths()
+        has_selection = bool(selected_paths)
+        single = len(selected_paths) == 1
 
-        # New file
-        new_file_action = menu.addAction("New File")
-        new_file_action.triggered.connect(self._create_new_file)
+        # Target path: selected item or current folder (for empty space click)
+        target_path = selected_paths[0] if selected_paths else self._current_path
 
-        menu.addSeparator()
+        self._ctx_paths = selected_paths
+        self._ctx_archives = [p for p in selected_paths if ArchiveManager.is_archive(p)]
+        self._ctx_reveal_path = target_path
+        self._ctx_shortcuts.clear()
 
-        # Show in Finder/Explorer
-        if sys.platform == "darwin":
-            reveal_action = menu.addAction("Reveal in Finder")
-        elif sys.platform == "win32":
-            reveal_action = menu.addAction("Open in Explorer")
-        else:
-            reveal_action = menu.addAction("Open in File Manager")
-
-        reveal_path = selected_paths[0] if selected_paths else self._current_path
-        if reveal_path:
-            reveal_action.triggered.connect(lambda: self._reveal_in_finder(reveal_path))
-
-        # Install key event filter for custom command shortcuts
-        if shortcut_actions:
-            menu.installEventFilter(
-                MenuShortcutFilter(
-                    menu,
-                    shortcut_actions,
-                    self._run_custom_command,
-                    self._extract_archives,
-                )
-            )
+        # Custom commands - show for selected file OR current folder (empty space click)
+        for action in self._ctx_custom_actions:
+            menu.removeAction(action)
+            action.deleteLater()
+        self._ctx_custom_actions = []
+        if target_path and len(selected_paths) <= 1:
+            custom_cmds = get_custom_commands_manager().get_commands_for_path(target_path)
+            if custom_cmds:
+                self._ctx_custom_actions.append(menu.insertSeparator(self._ctx_custom_anchor))
+            for cmd in custom_cmds:
+                # Show shortcut in menu name like "Open in Image Viewer(3)"
+                name = cmd.name
+                if cmd.shortcut:
+                    name = f"{cmd.name}({cmd.shortcut})"
+                    self._ctx_shortcuts[cmd.shortcut.upper()] = (cmd, target_path)
+                action = QAction(name, menu)
+                action.setData((cmd, target_path))
+                menu.insertAction(self._ctx_custom_anchor, action)
+                self._ctx_custom_actions.append(action)
+
+        # Open With submenu (macOS only for now)
+        self._ctx_open_with.menuAction().setVisible(_IS_MACOS and single)
+
+        actions["open"].setVisible(has_selection)
+        # Model's cached file info instead of a stat
+        actions["new_window"].setVisible(
+            single and self._model.isDir(self._model.index(str(selected_paths[0])))
+        )
+        for key in ("rename", "info"):
+            actions[key].setVisible(single)
+        for key in ("copy", "cut", "copy_path", "delete", "compress"):
+            actions[key].setVisible(has_selection)
+        actions["extract"].setVisible(bool(self._ctx_archives))
+        if self._ctx_archives:
+            self._ctx_shortcuts["Z"] = (None, self._ctx_archives)  # Special marker for extract
+        actions["quick_look"].setVisible(_IS_MACOS and single)
+        actions["reveal"].setEnabled(target_path is not None)
 
         view = self._current_view()
         menu.exec(view.mapToGlobal(pos))
 
+    def _on_ctx_action_triggered(self, action: QAction) -> None:
+        """Run the custom command attached to a triggered context menu action."""
+        command = action.data()
+        if command is not None:
+            self._run_custom_command(*command)
+
+    def _fill_open_with_menu(self) -> None:
+        """Populate the Open With submenu for the current selection as it opens."""
+        self._ctx_open_with.clear()
+        if self._ctx_paths:
+            self._populate_open_with_menu(self._ctx_open_with, self._ctx_paths[0])
+
     def _populate_open_with_menu(self, menu: QMenu, path: Path) -> None:
         """Populate Open With submenu with available apps."""
-        if sys.platform == "darwin":
+        if _IS_MACOS:
             try:
                 common_apps = [
                     ("TextEdit", "/System/Applications/TextEdit.app"),
@@ -175,7 +195,7 @@ class FileListContextMenuMixin:
                     if Path(app_path).exists():
                         action = menu.addAction(name)
                         action.triggered.connect(
-                            lambda checked, p=app_path: subprocess.run(["open", "-a", p, str(path)])
+                            partial(subprocess.run, ["open", "-a", app_path, str(path)])
                         )
 
                 menu.addSeparator()
@@ -191,7 +211,7 @@ class FileListContextMenuMixin:
 
     def _open_with_other(self, path: Path) -> None:
         """Open file with user-selected application."""
-        if sys.platform == "darwin":
+        if _IS_MACOS:
             subprocess.run(["open", "-a", "Finder", str(path)])
-        elif sys.platform == "win32":
+        elif _IS_WINDOWS:
             subprocess.run(["rundll32", "shell32.dll,OpenAs_RunDLL", str(path)])
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from pathlib import Path
 from enum import Enum
 from typing import TYPE_CHECKING
 
@@ -10,7 +9,7 @@ from PySide6.QtCore import Qt, QObject, QEvent
 from PySide6.QtWidgets import QFileSystemModel, QMenu
 from PySide6.QtGui import QColor, QBrush, QKeyEvent
 
-from commander.utils.themes import get_file_color
+from commander.utils.themes import get_theme_manager
 
 if TYPE_CHECKING:
     from typing import Callable
@@ -31,14 +30,19 @@ class ColoredFileSystemModel(QFileSystemModel):
         super().__init__(parent)
         # Enable editing for rename functionality
         self.setReadOnly(False)
+        # Color hex -> brush, so paints reuse one QBrush per color
+        self._brushes: dict[str, QBrush] = {}
 
     def data(self, index, role: int = Qt.ItemDataRole.DisplayRole):  # type: ignore[override]
         """Override data to provide custom foreground colors."""
         if role == Qt.ItemDataRole.ForegroundRole:
-            file_path = Path(self.filePath(index))
-            color_hex = get_file_color(file_path)
+            # Model's cached file info - no stat per paint
+            color_hex = get_theme_manager().get_name_color(self.fileName(index), self.isDir(index))
             if color_hex:
-                return QBrush(QColor(color_hex))
+                brush = self._brushes.get(color_hex)
+                if brush is None:
+                    brush = self._brushes[color_hex] = QBrush(QColor(color_hex))
+                return brush
 
         return super().data(index, role)
 
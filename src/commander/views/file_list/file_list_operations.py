@@ -2,12 +2,228 @@
 
 from __future__ import annotations
 
+import os
 import sys
+import shutil
 import subprocess
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator
+
+from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtWidgets import QMessageBox, QInputDialog, QApplication, QProgressDialog
+from shiboken6 import isValid
+
+from commander.core.file_operations import FileOperations
+from commander.core.archive_handler import ArchiveManager
+from commander.core.image_loader import ALL_IMAGE_FORMATS
+from commander.utils.custom_commands import get_custom_commands_manager
+from commander.utils.i18n import tr
+
+_IS_MACOS = sys.platform == "darwin"
+_IS_WINDOWS = sys.platform == "win32"
+
+# Platform opener for files (Windows uses os.startfile instead)
+_OPENER = {"darwin": "open"}.get(sys.platform, "xdg-open")
+
+# Builds the command that shows a path in the platform file manager
+_REVEAL_COMMAND = {
+    "darwin": lambda path: ["open", "-R", str(path)],
+    "win32": lambda path: ["explorer", "/select,", str(path)],
+}.get(sys.platform, lambda path: ["xdg-open", str(path.parent)])
+
+# Terminals tried in order on Linux/other platforms
+_TERMINALS = ("gnome-terminal", "konsole", "xterm")
+
+# Archives extracted at once by "Extract All" (extraction is mostly I/O and zlib/lzma,
+# which release the GIL)
+EXTRACT_WORKERS = 4
+
+# Read/write chunk size when streaming files into a ZIP archive
+ZIP_BUFFER_SIZE = 128 * 1024
+
+# Already-compressed formats; stored as-is since deflating them barely shrinks them
+ZIP_STORED_SUFFIXES = {
+    ".jpg",
+    ".jpeg",
+    ".png",
+    ".gif",
+    ".webp",
+    ".heic",
+    ".avif",  # Images
+    ".mp3",
+    ".aac",
+    ".m4a",
+    ".ogg",
+    ".opus",
+    ".flac",  # Audio
+    ".mp4",
+    ".m4v",
+    ".mov",
+    ".mkv",
+    ".webm",
+    ".avi",  # Video
+    ".zip",
+    ".7z",
+    ".rar",
+    ".gz",
+    ".tgz",
+    ".bz2",
+    ".xz",
+    ".zst",  # Archives
+    ".docx",
+    ".xlsx",
+    ".pptx",
+    ".jar",
+    ".apk",
+    ".epub",  # ZIP-based containers
+}
+
+
+def _iter_files(root: str) -> Iterator[str]:
+    """Yield paths of all files under root (os.scandir walk, symlinked dirs not followed)."""
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path
+
+
+def _is_image_entry(entry: os.DirEntry, suffixes: tuple[str, ...]) -> bool:
+    """Check if a directory entry is a file ending in one of the (lowercase) suffixes."""
+    return entry.name.lower().endswith(suffixes) and entry.is_file()
+
+
+def _has_image_file(dir_path: str, suffixes: tuple[str, ...]) -> bool:
+    """Check if a directory directly contains an image file (unreadable dirs count as no)."""
+    try:
+        with os.scandir(dir_path) as entries:
+            return any(_is_image_entry(entry, suffixes) for entry in entries)
+    except OSError:
+        return False
+
+
+def _zip_write(zf: zipfile.ZipFile, file_path: str, arcname: str) -> None:
+    """Stream a file into the archive using large buffers."""
+    info = zipfile.ZipInfo.from_file(file_path, arcname)
+    if os.path.splitext(file_path)[1].lower() in ZIP_STORED_SUFFIXES:
+        info.compress_type = zipfile.ZIP_STORED
+    else:
+        info.compress_type = zf.compression
+    with open(file_path, "rb", buffering=ZIP_BUFFER_SIZE) as src:
+        # ZipFile picks ZIP64 from info.file_size, only for entries that need it
+        with zf.open(info, "w") as dst:
+            shutil.copyfileobj(src, dst, ZIP_BUFFER_SIZE)
+
+
+class CompressWorker(QThread):
+    """Worker thread that writes a ZIP archive."""
+
+    progress = Signal(int, int, str)  # current, total, filename
+    compressed = Signal(str)  # zip path
+    error = Signal(str)
+
+    def __init__(self, paths: list[Path], zip_path: Path):
+        super().__init__()
+        self._paths = paths
+        self._zip_path = zip_path
+        self._cancelled = False
+
+    def run(self):
+        """Collect files and write them into the archive."""
+        try:
+            # (source, arcname) for every file; folders keep their name as prefix
+            entries: list[tuple[str, str]] = []
+            for path in self._paths:
+                if path.is_file():
+                    entries.append((str(path), path.name))
+                elif path.is_dir():
+                    root = str(path)
+                    entries.extend((f, path.name + f[len(root) :]) for f in _iter_files(root))
+
+            total = len(entries)
+            with zipfile.ZipFile(self._zip_path, "w", zipfile.ZIP_DEFLATED, allowZip64=True) as zf:
+                for i, (file, arcname) in enumerate(entries):
+                    if self._cancelled:
+                        break
+                    self.progress.emit(i, total, arcname)
+                    _zip_write(zf, file, arcname)
+
+            if self._cancelled:
+                self._zip_path.unlink(missing_ok=True)
+            else:
+                self.compressed.emit(str(self._zip_path))
+        except Exception as e:
+            # Don't leave a truncated archive behind
+            self._zip_path.unlink(missing_ok=True)
+            self.error.emit(str(e))
+
+    def cancel(self):
+        """Cancel the operation."""
+        self._cancelled = True
+
+
+class ExtractWorker(QThread):
+    """Worker thread that extracts archives next to themselves."""
+
+    extracted = Signal(list)  # error messages, "archive name: error"
+
+    def __init__(self, archives: list[Path]):
+        super().__init__()
+        self._archives = archives
+        self._cancelled = False
+
+    def run(self):
+        """Extract archives in parallel, serially where their output would overlap."""
+        errors: list[str] = []
+        with ThreadPoolExecutor(max_workers=min(EXTRACT_WORKERS, len(self._archives))) as pool:
+            roots = [
+                (path, pool.submit(ArchiveManager.smart_extract_root, path, path.parent))
+                for path in self._archives
+            ]
+
+            # Archives writing into the same top-level path (same stem, or the same single
+            # folder) share a group; compared case-insensitively for macOS/Windows
+            groups: dict[str, list[Path]] = {}
+            for path, future in roots:
+                try:
+                    root = future.result()
+                except Exception as e:
+                    errors.append(f"{path.name}: {e}")
+                    continue
+                groups.setdefault(str(root).lower(), []).append(path)
+
+            futures = [pool.submit(self._extract_group, group) for group in groups.values()]
+            for future in futures:
+                errors.extend(future.result())
+
+        self.extracted.emit(errors)
+
+    def _extract_group(self, archives: list[Path]) -> list[str]:
+        """Extract archives one after another; returns error messages."""
+        errors = []
+        for path in archives:
+            if self._cancelled:
+                break
+            try:
+                # Smart extract: if single top-level folder, extract directly
+                # Otherwise, create folder named after archive
+                ArchiveManager.smart_extract(path, path.parent)
+            except Exception as e:
+                errors.append(f"{path.name}: {e}")
+        return errors
 
-from PySide6.QtWidgets import QMessageBox, QInputDialog, QApplication
+    def cancel(self):
+        """Cancel the operation (archives already being extracted are finished)."""
+        self._cancelled = True
 
 
 class FileListOperationsMixin:
@@ -16,11 +232,10 @@ class FileListOperationsMixin:
     # Expected from main class
     _current_path: Path | None
     _viewer: object
+    _workers: list[QThread]
 
     def _run_custom_command(self, cmd, path: Path) -> None:
         """Run a custom command."""
-        from commander.utils.custom_commands import get_custom_commands_manager
-
         mgr = get_custom_commands_manager()
         if mgr.is_builtin_command(cmd):
             # Handle built-in commands
@@ -33,8 +248,6 @@ class FileListOperationsMixin:
 
     def _extract_archive(self, path: Path) -> None:
         """Extract archive to same directory."""
-        from commander.core.archive_handler import ArchiveManager
-
         if not path.is_file():
             return
 
@@ -44,8 +257,7 @@ class FileListOperationsMixin:
         try:
             ArchiveManager.extract(path, extract_dir)
             # Refresh view
-            if self._current_path:
-                self.set_root_path(self._current_path)
+            self._schedule_refresh()
         except Exception as e:
             QMessageBox.warning(
                 self,
@@ -55,28 +267,45 @@ class FileListOperationsMixin:
 
     def _extract_archives(self, paths: list[Path]) -> None:
         """Extract multiple archives to their respective directories."""
-        from commander.core.archive_handler import ArchiveManager
-
-        if not paths:
+        # Later volumes of a split archive are extracted along with the first one
+        archives = [
+            path
+            for path in dict.fromkeys(map(ArchiveManager.get_first_volume, paths))
+            if path.is_file()
+        ]
+        if not archives:
             return
 
-        errors = []
-        for path in paths:
-            if not path.is_file():
-                continue
-
-            try:
-                # Smart extract: if single top-level folder, extract directly
-                # Otherwise, create folder named after archive
-                ArchiveManager.smart_extract(path, path.parent)
-            except Exception as e:
-                errors.append(f"{path.name}: {e}")
-
-        # Refresh view and restore selection to original archives
-        if self._current_path:
-            self.set_root_path(self._current_path)
-            # Clear selection and re-select only the original archive files
-            self._select_paths(paths)
+        # Extract in the background; the dialog only shows that work is going on
+        progress = QProgressDialog(
+            f"Extracting {len(archives)} archive(s)...", "Cancel", 0, 0, self
+        )
+        progress.setWindowTitle("Extract")
+        progress.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        progress.setMinimumDuration(500)
+
+        directory = self._current_path
+        worker = ExtractWorker(archives)
+        worker.extracted.connect(lambda errors: self._on_extract_finished(paths, directory, errors))
+        worker.finished.connect(progress.close)
+        progress.canceled.connect(worker.cancel)
+
+        # Keep a reference until the thread is done
+        self._workers.append(worker)
+        worker.finished.connect(lambda: self._workers.remove(worker))
+        worker.finished.connect(worker.deleteLater)
+        worker.start()
+
+    def _on_extract_finished(
+        self, paths: list[Path], directory: Path | None, errors: list[str]
+    ) -> None:
+        """Refresh the view and restore the selection once archives are extracted."""
+        # Only touch the selection if the user is still in the same folder
+        if self._current_path is not None and self._current_path == directory:
+            self._schedule_refresh()
+            # Re-select only the original archive files, unless they already are
+            if set(self.get_selected_paths()) != set(paths):
+                self._select_paths(paths)
 
         if errors:
             QMessageBox.warning(
@@ -87,14 +316,9 @@ class FileListOperationsMixin:
 
     def _is_viewer_valid(self) -> bool:
         """Check if the viewer instance is still valid."""
-        try:
-            if not hasattr(self, "_viewer") or self._viewer is None:
-                return False
-            # Try to access a property to check if C++ object is still alive
-            self._viewer.isVisible()
-            return True
-        except RuntimeError:
-            return False
+        viewer = getattr(self, "_viewer", None)
+        # isValid() is False once the C++ object has been deleted
+        return viewer is not None and isValid(viewer)
 
     def _get_or_create_viewer(self):
         """Get existing viewer or create a new one."""
@@ -106,11 +330,11 @@ class FileListOperationsMixin:
 
     def _open_builtin_image_viewer(self, path: Path) -> None:
         """Open built-in image viewer."""
-        from commander.core.image_loader import ALL_IMAGE_FORMATS
-        from commander.core.archive_handler import ArchiveManager
+        # str.endswith takes a tuple - one C-level test per name
+        suffixes = tuple(ALL_IMAGE_FORMATS)
 
         if path.is_dir():
-            images = self._collect_images_from_dir(path, ALL_IMAGE_FORMATS)
+            images = self._collect_images_from_dir(path, suffixes)
             if images:
                 path = images[0]
             else:
@@ -122,27 +346,24 @@ class FileListOperationsMixin:
             return
         else:
             # Get all images in same directory
-            parent = path.parent
-            images = sorted([p for p in parent.iterdir() if p.suffix.lower() in ALL_IMAGE_FORMATS])
+            with os.scandir(path.parent) as entries:
+                images = sorted(
+                    Path(entry.path) for entry in entries if _is_image_entry(entry, suffixes)
+                )
 
         viewer = self._get_or_create_viewer()
         viewer.show_image(path, images)
 
-    def _collect_images_from_dir(self, path: Path, formats: set) -> list[Path]:
+    def _collect_images_from_dir(self, path: Path, suffixes: tuple[str, ...]) -> list[Path]:
         """Collect images from directory, optionally including subdirectories."""
-        from commander.utils.i18n import tr
+        # One directory read; DirEntry already knows each entry's type
+        with os.scandir(path) as it:
+            entries = list(it)
 
         # Check if there are subdirectories with images
-        subdirs = [p for p in path.iterdir() if p.is_dir()]
-        has_subdirs_with_images = False
-
-        for subdir in subdirs:
-            try:
-                if any(p.suffix.lower() in formats for p in subdir.iterdir() if p.is_file()):
-                    has_subdirs_with_images = True
-                    break
-            except PermissionError:
-                continue
+        has_subdirs_with_images = any(
+            _has_image_file(entry.path, suffixes) for entry in entries if entry.is_dir()
+        )
 
         include_subdirs = False
         if has_subdirs_with_images:
@@ -156,64 +377,49 @@ class FileListOperationsMixin:
             include_subdirs = reply == QMessageBox.StandardButton.Yes
 
         if include_subdirs:
-            # Recursively collect all images
+            # Recursively collect all images; only the matches are sorted
             images = []
-            for p in sorted(path.rglob("*")):
-                if p.is_file() and p.suffix.lower() in formats:
-                    images.append(p)
+            for root, _dirs, files in os.walk(path):
+                root_path = Path(root)
+                images.extend(root_path / name for name in files if name.lower().endswith(suffixes))
+            images.sort()
             return images
         else:
             # Only current directory
-            return sorted(
-                [p for p in path.iterdir() if p.is_file() and p.suffix.lower() in formats]
-            )
+            return sorted(Path(entry.path) for entry in entries if _is_image_entry(entry, suffixes))
 
     def _open_with_default(self, path: Path) -> None:
         """Open file with default application."""
-        if sys.platform == "darwin":
-            subprocess.run(["open", str(path)])
-        elif sys.platform == "win32":
-            import os
-
+        if _IS_WINDOWS:
             os.startfile(str(path))
         else:
-            subprocess.run(["xdg-open", str(path)])
+            subprocess.run([_OPENER, str(path)])
 
     def _copy_files(self, paths: list[Path]) -> None:
         """Copy files to clipboard."""
-        from commander.core.file_operations import FileOperations
-
-        ops = FileOperations()
-        ops.copy_to_clipboard(paths)
+        FileOperations().copy_to_clipboard(paths)
 
     def _cut_files(self, paths: list[Path]) -> None:
         """Cut files to clipboard."""
-        from commander.core.file_operations import FileOperations
-
-        ops = FileOperations()
-        ops.cut_to_clipboard(paths)
+        FileOperations().cut_to_clipboard(paths)
 
     def _paste_files(self) -> None:
         """Paste files from clipboard."""
-        from commander.core.file_operations import FileOperations
         from commander.widgets.progress_dialog import ProgressDialog
 
         if self._current_path is None:
             return
 
-        ops = FileOperations()
-        if not ops.has_clipboard():
+        if not FileOperations().has_clipboard():
             return
 
         # Use progress dialog for paste operation
         dialog = ProgressDialog("paste", [], self._current_path, self)
         dialog.exec()
-        self.set_root_path(self._current_path)
+        self._schedule_refresh()
 
     def _delete_files(self, paths: list[Path]) -> None:
         """Delete files."""
-        from commander.core.file_operations import FileOperations
-
         if self._current_path is None:
             return
 
@@ -224,9 +430,8 @@ class FileListOperationsMixin:
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
         )
         if reply == QMessageBox.StandardButton.Yes:
-            ops = FileOperations()
-            ops.delete(paths)
-            self.set_root_path(self._current_path)
+            FileOperations().delete(paths)
+            self._schedule_refresh()
 
     def _create_new_folder(self) -> None:
         """Create new folder."""
@@ -238,7 +443,7 @@ class FileListOperationsMixin:
             new_path = self._current_path / name
             try:
                 new_path.mkdir()
-                self.set_root_path(self._current_path)
+                self._schedule_refresh()
             except OSError as e:
                 QMessageBox.warning(self, "Error", f"Cannot create folder: {e}")
 
@@ -252,7 +457,7 @@ class FileListOperationsMixin:
             new_path = self._current_path / name
             try:
                 new_path.touch()
-                self.set_root_path(self._current_path)
+                self._schedule_refresh()
             except OSError as e:
                 QMessageBox.warning(self, "Error", f"Cannot create file: {e}")
 
@@ -280,21 +485,40 @@ class FileListOperationsMixin:
             if reply != QMessageBox.StandardButton.Yes:
                 return
 
-        try:
-            with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
-                for path in paths:
-                    if path.is_file():
-                        zf.write(path, path.name)
-                    elif path.is_dir():
-                        for file in path.rglob("*"):
-                            if file.is_file():
-                                arcname = path.name / file.relative_to(path)
-                                zf.write(file, arcname)
-
-            self.set_root_path(self._current_path)
-            QMessageBox.information(self, "Success", f"Created {zip_path.name}")
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Compression failed: {e}")
+        # Write the archive in the background; the dialog only shows progress
+        progress = QProgressDialog(f"Compressing {zip_path.name}...", "Cancel", 0, 0, self)
+        progress.setWindowTitle("Compress")
+        progress.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        progress.setMinimumDuration(500)
+
+        def on_progress(current: int, total: int, name: str) -> None:
+            progress.setMaximum(total)
+            progress.setValue(current)
+            progress.setLabelText(name)
+
+        worker = CompressWorker(paths, zip_path)
+        worker.progress.connect(on_progress)
+        worker.compressed.connect(self._on_compress_finished)
+        worker.error.connect(
+            lambda error: QMessageBox.warning(self, "Error", f"Compression failed: {error}")
+        )
+        worker.finished.connect(progress.close)
+        progress.canceled.connect(worker.cancel)
+
+        # Keep a reference until the thread is done
+        self._workers.append(worker)
+        worker.finished.connect(lambda: self._workers.remove(worker))
+        worker.finished.connect(worker.deleteLater)
+        worker.start()
+
+    def _on_compress_finished(self, zip_path: str) -> None:
+        """Refresh the view and select the new archive once compression has finished."""
+        path = Path(zip_path)
+        # Only touch the selection if the user is still in the same folder
+        if self._current_path is not None and self._current_path == path.parent:
+            self._schedule_refresh()
+            self._select_paths([path])
+        QMessageBox.information(self, "Success", f"Created {path.name}")
 
     def _open_terminal(self) -> None:
         """Open terminal at current path."""
@@ -302,16 +526,16 @@ class FileListOperationsMixin:
         if path is None:
             return
 
-        if sys.platform == "darwin":
+        if _IS_MACOS:
             script = f'tell app "Terminal" to do script "cd {path}"'
             subprocess.run(["osascript", "-e", script])
-        elif sys.platform == "win32":
+        elif _IS_WINDOWS:
             subprocess.Popen(
                 ["powershell", "-NoExit", "-Command", f"cd '{path}'"],
                 creationflags=subprocess.CREATE_NEW_CONSOLE,
             )
         else:
-            for term in ["gnome-terminal", "konsole", "xterm"]:
+            for term in _TERMINALS:
                 try:
                     subprocess.Popen([term, "--working-directory", str(path)])
                     break
@@ -320,20 +544,12 @@ class FileListOperationsMixin:
 
     def _reveal_in_finder(self, path: Path) -> None:
         """Reveal file/folder in Finder/Explorer."""
-        if sys.platform == "darwin":
-            subprocess.run(["open", "-R", str(path)])
-        elif sys.platform == "win32":
-            subprocess.run(["explorer", "/select,", str(path)])
-        else:
-            subprocess.run(["xdg-open", str(path.parent)])
+        subprocess.run(_REVEAL_COMMAND(path))
 
     def _copy_path(self, paths: list[Path]) -> None:
         """Copy file paths to clipboard."""
-        clipboard = QApplication.clipboard()
-        if len(paths) == 1:
-            clipboard.setText(str(paths[0]))
-        else:
-            clipboard.setText("\n".join(str(p) for p in paths))
+        # One path per line (a single path is copied as-is)
+        QApplication.clipboard().setText("\n".join(map(os.fspath, paths)))
 
     def _show_info(self, path: Path) -> None:
         """Show file/folder info dialog."""
@@ -344,20 +560,26 @@ class FileListOperationsMixin:
 
     def _quick_look(self, path: Path) -> None:
         """Open Quick Look preview (macOS only)."""
-        if sys.platform == "darwin":
+        if _IS_MACOS:
             subprocess.run(
                 ["qlmanage", "-p", str(path)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
             )
 
-    def _on_files_dropped(self, paths: list[Path], destination: Path) -> None:
+    def _on_files_dropped(self, paths: list[str], destination: Path) -> None:
         """Handle files dropped from external app (e.g., Finder)."""
         from commander.widgets.progress_dialog import ProgressDialog
 
         if self._current_path is None:
             return
 
-        # Filter out files that are already in the destination
-        paths_to_copy = [p for p in paths if p.parent != destination]
+        # Filter out duplicates and files already in the destination (compared as strings)
+        dest_str = os.path.normpath(destination)
+        seen: set[str] = set()
+        paths_to_copy: list[Path] = []
+        for p in map(os.path.normpath, paths):
+            if p not in seen and os.path.dirname(p) != dest_str:
+                seen.add(p)
+                paths_to_copy.append(Path(p))
         if not paths_to_copy:
             return
 
@@ -375,13 +597,14 @@ class FileListOperationsMixin:
         if reply == QMessageBox.StandardButton.Cancel:
             return
 
-        if reply == QMessageBox.StandardButton.Yes:
-            # Copy
-            dialog = ProgressDialog("copy", paths_to_copy, destination, self)
-            dialog.exec()
-        else:
-            # Move
-            dialog = ProgressDialog("move", paths_to_copy, destination, self)
-            dialog.exec()
-
-        self.set_root_path(self._current_path)
+        # Copy on Yes, move on No; the worker runs while the UI stays usable
+        operation = "copy" if reply == QMessageBox.StandardButton.Yes else "move"
+        dialog = ProgressDialog(operation, paths_to_copy, destination, self)
+        dialog.setModal(False)
+        dialog.finished.connect(self._on_drop_finished)
+        dialog.finished.connect(dialog.deleteLater)
+        dialog.show()
+
+    def _on_drop_finished(self, _result: int) -> None:
+        """Refresh the view once a dropped copy/move has finished."""
+        self._schedule_refresh()
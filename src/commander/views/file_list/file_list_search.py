@@ -2,161 +2,304 @@
 
 from __future__ import annotations
 
+import bisect
+from collections import Counter
 from pathlib import Path
 
-from PySide6.QtCore import Qt, QModelIndex
+from PySide6.QtCore import QEvent, Qt
+
+from commander.utils.fuzzy_match import HAS_NUMBA, PackedNames, fuzzy_score
+from commander.utils.custom_commands import get_custom_commands_manager
 
 
 class FileListSearchMixin:
     """Mixin providing fuzzy search functionality."""
 
+    # Pattern length from which a plain substring hit is preferred over fuzzy scoring
+    SUBSTRING_MIN_LENGTH = 3
+
+    # Candidate count from which the compiled (numba) scorer is used
+    NUMBA_MIN_NAMES = 10000
+
+    # Search results remembered per directory listing (backspace/retype is free)
+    RESULT_CACHE_SIZE = 256
+
     # Expected from main class
     _current_path: Path | None
     _search_text: str
     _search_label: object
     _search_timer: object
+    _search_delay_timer: object
     _model: object
 
+    # Lowercased file names of the current directory, by row (None = rebuild)
+    _search_names: list[str] | None = None
+
+    # _search_names packed for the compiled scorer, built lazily
+    _search_packed: PackedNames | None = None
+
+    # Character -> number of _search_names containing it, built lazily
+    _search_char_counts: Counter[str] | None = None
+
+    # (_search_names sorted, their rows) for bisecting prefix matches, built lazily
+    _search_sorted: tuple[list[str], list[int]] | None = None
+
+    # (pattern, rows that may still fuzzy-match) of the last search
+    _search_state: tuple[str, list[int]] | None = None
+
+    # Pattern -> best matching row of the current listing, oldest first
+    _search_results: dict[str, int | None] | None = None
+
+    # Height of the search overlay when it was last positioned (-1 = never)
+    _search_label_height: int = -1
+
+    # Event type -> handler method name; other events skip straight to Qt
+    _EVENT_HANDLERS = {
+        QEvent.Type.FocusIn: "_handle_focus_event",
+        QEvent.Type.FocusOut: "_handle_focus_event",
+        QEvent.Type.KeyPress: "_handle_key_press",
+    }
+
     def eventFilter(self, obj, event) -> bool:
         """Filter key events from child views for fuzzy search and custom commands."""
-        # Handle focus events from child views
-        if event.type() in (event.Type.FocusIn, event.Type.FocusOut):
-            self._update_focus_style()
+        # Called for every event of both views (mouse moves, paints...) - one lookup
+        handler = self._EVENT_HANDLERS.get(event.type())
+        if handler is not None and getattr(self, handler)(event):
+            return True
+        return super().eventFilter(obj, event)
 
-        if event.type() == event.Type.KeyPress:
-            key = event.key()
-            text = event.text()
+    def _handle_focus_event(self, event) -> bool:
+        """Update the focus border when a child view gains or loses focus."""
+        self._update_focus_style()
+        return False
 
-            # Escape clears search
-            if key == Qt.Key.Key_Escape and self._search_text:
-                self._clear_search()
-                return True
-
-            # Backspace removes last character from search
-            if key == Qt.Key.Key_Backspace and self._search_text:
-                self._search_text = self._search_text[:-1]
-                if self._search_text:
-                    self._do_fuzzy_search()
-                else:
-                    self._clear_search()
-                return True
-
-            # Only handle printable characters (no modifiers except shift)
-            modifiers = event.modifiers()
-            has_ctrl_or_meta = modifiers & (
-                Qt.KeyboardModifier.ControlModifier | Qt.KeyboardModifier.MetaModifier
-            )
-
-            if text and text.isprintable() and not has_ctrl_or_meta:
-                # Check for custom command shortcut first (only when not searching)
-                if not self._search_text:
-                    if self._try_custom_command_shortcut(text.upper()):
-                        return True
-
-                self._search_text += text.lower()
-                self._do_fuzzy_search()
-                self._search_timer.start()
-                return True
+    def _handle_key_press(self, event) -> bool:
+        """Handle a key press from a child view. Returns True if consumed."""
+        key = event.key()
+        text = event.text()
 
-        return super().eventFilter(obj, event)
+        # Escape clears search
+        if key == Qt.Key.Key_Escape and self._search_text:
+            self._clear_search()
+            return True
+
+        # Backspace removes last character from search
+        if key == Qt.Key.Key_Backspace and self._search_text:
+            return self.handle_backspace()
+
+        # Only handle printable characters (no modifiers except shift)
+        modifiers = event.modifiers()
+        has_ctrl_or_meta = modifiers & (
+            Qt.KeyboardModifier.ControlModifier | Qt.KeyboardModifier.MetaModifier
+        )
+
+        if text and text.isprintable() and not has_ctrl_or_meta:
+            # Check for custom command shortcut first (only when not searching)
+            if not self._search_text:
+                if self._try_custom_command_shortcut(text.upper()):
+                    return True
+
+            self._search_text += text.lower()
+            self._update_search()
+            self._search_timer.start()
+            return True
+
+        # Any other key (Enter, arrows...) acts on the match - select it first
+        if self._search_delay_timer.isActive():
+            self._search_delay_timer.stop()
+            self._do_fuzzy_search()
+        return False
 
     def _try_custom_command_shortcut(self, shortcut: str) -> bool:
         """Try to execute custom command by shortcut. Returns True if handled."""
-        from commander.utils.custom_commands import get_custom_commands_manager
-
         selected_paths = self.get_selected_paths()
         if not selected_paths:
             return False
 
         path = selected_paths[0]
-        mgr = get_custom_commands_manager()
+        cmd = get_custom_commands_manager().get_command_for_shortcut(path, shortcut)
+        if cmd is None:
+            return False
 
-        for cmd in mgr.get_commands_for_path(path):
-            if cmd.shortcut and cmd.shortcut.upper() == shortcut:
-                self._run_custom_command(cmd, path)
-                return True
+        self._run_custom_command(cmd, path)
+        return True
 
-        return False
+    def _update_search(self) -> None:
+        """Show the search text now and match it once typing pauses."""
+        # Show search overlay (only grows sideways while typing - re-anchor on height change)
+        label = self._search_label
+        label.setText(f"Search: {self._search_text}")
+        label.adjustSize()
+        if label.height() != self._search_label_height:
+            self._place_search_label()
+        label.show()
+
+        self._search_delay_timer.start()
+
+    def _place_search_label(self) -> None:
+        """Anchor the search overlay to the bottom-left corner."""
+        label = self._search_label
+        label.move(10, self.height() - label.height() - 10)
+        self._search_label_height = label.height()
 
     def _do_fuzzy_search(self) -> None:
         """Perform fuzzy search and select matching file."""
         if not self._search_text or not self._current_path:
             return
 
-        # Show search overlay
-        self._search_label.setText(f"Search: {self._search_text}")
-        self._search_label.adjustSize()
-        self._search_label.move(10, self.height() - self._search_label.height() - 10)
-        self._search_label.show()
-
-        # Get all items in current directory
         view = self._current_view()
-        model = self._model
         root_index = view.rootIndex()
-
-        best_match: QModelIndex | None = None
-        best_score = -1
-
-        for row in range(model.rowCount(root_index)):
-            index = model.index(row, 0, root_index)
-            filename = model.fileName(index).lower()
-
-            # Calculate fuzzy match score
-            score = self._fuzzy_score(self._search_text, filename)
-            if score > best_score:
-                best_score = score
-                best_match = index
-
-        # Select best match
-        if best_match is not None and best_score > 0:
+        names = self._get_search_names()
+
+        if self._search_results is None:
+            self._search_results = {}
+        results = self._search_results
+        if self._search_text in results:
+            row = results[self._search_text]
+        else:
+            row = self._find_best_match(self._search_text, names)
+            if len(results) >= self.RESULT_CACHE_SIZE:
+                del results[next(iter(results))]
+            results[self._search_text] = row
+
+        # Select best match (unless it is already the current item, e.g. a longer
+        # prefix of the same name - re-selecting would reload the preview)
+        if row is not None:
+            best_match = self._model.index(row, 0, root_index)
+            if best_match == view.currentIndex() and view.selectionModel().isSelected(best_match):
+                return
             view.setCurrentIndex(best_match)
             view.scrollTo(best_match)
             self._on_clicked(best_match)
 
+    def _get_search_names(self) -> list[str]:
+        """Get lowercased file names of the current directory (cached per directory)."""
+        if self._search_names is None:
+            model = self._model
+            root_index = self._current_view().rootIndex()
+            self._search_names = [
+                model.fileName(model.index(row, 0, root_index)).lower()
+                for row in range(model.rowCount(root_index))
+            ]
+        return self._search_names
+
+    def _on_search_rows_inserted(self, parent, first: int, last: int) -> None:
+        """Insert names for new rows of the current directory into the cache."""
+        if self._search_names is None or parent != self._current_view().rootIndex():
+            return
+        model = self._model
+        self._search_names[first:first] = [
+            model.fileName(model.index(row, 0, parent)).lower() for row in range(first, last + 1)
+        ]
+        # Row numbers shifted
+        self._reset_search_indexes()
+
+    def _on_search_rows_removed(self, parent, first: int, last: int) -> None:
+        """Remove names of deleted rows of the current directory from the cache."""
+        if self._search_names is None or parent != self._current_view().rootIndex():
+            return
+        del self._search_names[first : last + 1]
+        self._reset_search_indexes()
+
+    def _invalidate_search_names(self, *args) -> None:
+        """Drop cached file names (directory changed or rows added/removed/re-sorted)."""
+        self._search_names = None
+        self._reset_search_indexes()
+
+    def _reset_search_indexes(self) -> None:
+        """Drop everything derived from _search_names and its row numbers."""
+        self._search_packed = None
+        self._search_char_counts = None
+        self._search_sorted = None
+        self._search_state = None
+        self._search_results = None
+
+    def _find_best_match(self, pattern: str, names: list[str]) -> int | None:
+        """Return the row of the best match for pattern, or None."""
+        # Exact prefix match wins outright - no fuzzy scoring needed
+        row = self._prefix_match(pattern, names)
+        if row is not None:
+            return row
+
+        # Typing another character can only shrink the previous hit set
+        state = self._search_state
+        if state is not None and pattern.startswith(state[0]):
+            match_rows = state[1]
+        else:
+            match_rows = list(range(len(names)))
+
+        # Longer alphanumeric text is usually a substring - earliest occurrence wins
+        if len(pattern) >= self.SUBSTRING_MIN_LENGTH and pattern.isalnum():
+            best_row, best_pos = None, -1
+            for row in match_rows:
+                pos = names[row].find(pattern)
+                if pos > 0 and (best_row is None or pos < best_pos):
+                    best_row, best_pos = row, pos
+            if best_row is not None:
+                self._search_state = (pattern, match_rows)
+                return best_row
+
+        if HAS_NUMBA and len(match_rows) >= self.NUMBA_MIN_NAMES:
+            # Large directory: score all candidates in one compiled pass
+            if self._search_packed is None:
+                self._search_packed = PackedNames(names)
+            best_row, hits = self._search_packed.best_match(pattern, match_rows)
+            self._search_state = (pattern, hits)
+            return best_row
+
+        # Names lacking the pattern's least common character can't match
+        if self._search_char_counts is None:
+            self._search_char_counts = Counter(char for name in names for char in set(name))
+        rare = min(pattern, key=self._search_char_counts.__getitem__)
+
+        best_row: int | None = None
+        best_score = 0
+        hits: list[int] = []
+        for row in match_rows:
+            name = names[row]
+            if rare not in name:
+                continue
+            # Calculate fuzzy match score
+            score = self._fuzzy_score(pattern, name)
+            if score > 0:
+                hits.append(row)
+                if score > best_score:
+                    best_score = score
+                    best_row = row
+
+        self._search_state = (pattern, hits)
+        return best_row
+
+    def _prefix_match(self, pattern: str, names: list[str]) -> int | None:
+        """Return the first row whose name starts with pattern, or None."""
+        if self._search_sorted is None:
+            rows = sorted(range(len(names)), key=names.__getitem__)
+            self._search_sorted = ([names[row] for row in rows], rows)
+
+        sorted_names, rows = self._search_sorted
+        start = bisect.bisect_left(sorted_names, pattern)
+        end = bisect.bisect_left(sorted_names, pattern + "\U0010ffff", start)
+        # Names sharing the prefix are adjacent once sorted; pick the topmost in the view
+        return min(rows[start:end], default=None)
+
     def _fuzzy_score(self, pattern: str, text: str) -> int:
         """Calculate fuzzy match score. Higher is better."""
-        if not pattern:
-            return 0
-
-        # Exact prefix match gets highest score
-        if text.startswith(pattern):
-            return 1000 + len(pattern)
-
-        # Check if all characters appear in order
-        pattern_idx = 0
-        score = 0
-        consecutive = 0
-
-        for i, char in enumerate(text):
-            if pattern_idx < len(pattern) and char == pattern[pattern_idx]:
-                pattern_idx += 1
-                consecutive += 1
-                # Bonus for consecutive matches
-                score += consecutive * 10
-                # Bonus for match at start
-                if i == 0:
-                    score += 50
-            else:
-                consecutive = 0
-
-        # All pattern characters must be found
-        if pattern_idx < len(pattern):
-            return 0
-
-        return score
+        return fuzzy_score(pattern, text)
 
     def _clear_search(self) -> None:
         """Clear fuzzy search."""
         self._search_text = ""
+        self._search_state = None
         self._search_label.hide()
         self._search_timer.stop()
+        self._search_delay_timer.stop()
 
     def handle_backspace(self) -> bool:
         """Handle backspace key for search. Returns True if handled."""
         if self._search_text:
             self._search_text = self._search_text[:-1]
             if self._search_text:
-                self._do_fuzzy_search()
+                self._update_search()
             else:
                 self._clear_search()
             return True
@@ -4,7 +4,17 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from PySide6.QtCore import Qt, Signal, QDir, QModelIndex, QSize, QTimer
+from PySide6.QtCore import (
+    Qt,
+    Signal,
+    QDir,
+    QItemSelection,
+    QItemSelectionModel,
+    QModelIndex,
+    QPoint,
+    QSize,
+    QTimer,
+)
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -27,6 +37,15 @@ from commander.utils.settings import Settings
 class FileListView(FileListSearchMixin, FileListOperationsMixin, FileListContextMenuMixin, QWidget):
     """Center panel file list view with multiple view modes."""
 
+    # Delay before prefetching thumbnails after a scroll (coalesces scroll bursts)
+    PREFETCH_DELAY_MS = 50
+
+    # Delay before refreshing after a file operation (coalesces back-to-back ops)
+    REFRESH_DELAY_MS = 100
+
+    # Delay before matching typed search text (fast typing is matched once)
+    SEARCH_DELAY_MS = 80
+
     item_selected = Signal(Path)
     item_activated = Signal(Path)
     request_compress = Signal(list)
@@ -44,8 +63,19 @@ class FileListView(FileListSearchMixin, FileListOperationsMixin, FileListContext
             | QDir.Filter.System
         )
 
+        # Keep cached search names in sync with the directory listing
+        self._model.rowsInserted.connect(self._on_search_rows_inserted)
+        self._model.rowsRemoved.connect(self._on_search_rows_removed)
+        for signal in (
+            self._model.layoutChanged,
+            self._model.modelReset,
+            self._model.fileRenamed,
+        ):
+            signal.connect(self._invalidate_search_names)
+
         self._view_mode = ViewMode.LIST
         self._current_path: Path | None = None
+        self._workers: list = []  # Background ZIP/extract workers still running
 
         # Fuzzy search
         self._settings = Settings()
@@ -54,6 +84,22 @@ class FileListView(FileListSearchMixin, FileListOperationsMixin, FileListContext
         self._search_timer.setSingleShot(True)
         self._search_timer.setInterval(self._settings.load_fuzzy_search_timeout())
         self._search_timer.timeout.connect(self._clear_search)
+        self._search_delay_timer = QTimer()
+        self._search_delay_timer.setSingleShot(True)
+        self._search_delay_timer.setInterval(self.SEARCH_DELAY_MS)
+        self._search_delay_timer.timeout.connect(self._do_fuzzy_search)
+
+        # Thumbnail prefetch
+        self._prefetch_timer = QTimer()
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(self.PREFETCH_DELAY_MS)
+        self._prefetch_timer.timeout.connect(self._prefetch_visible_thumbnails)
+
+        # Refresh after file operations
+        self._refresh_timer = QTimer()
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.REFRESH_DELAY_MS)
+        self._refresh_timer.timeout.connect(self._refresh)
 
         self._setup_ui()
 
@@ -115,6 +161,8 @@ class FileListView(FileListSearchMixin, FileListOperationsMixin, FileListContext
         # Thumbnail delegate
         self._thumbnail_delegate = ThumbnailDelegate(self._list_view)
         self._default_delegate = self._list_view.itemDelegate()
+        self._model.rowsRemoved.connect(self._thumbnail_delegate.clear_cache)
+        self._list_view.verticalScrollBar().valueChanged.connect(self._prefetch_timer.start)
 
         self._stack.addWidget(self._list_view)
 
@@ -158,6 +206,11 @@ class FileListView(FileListSearchMixin, FileListOperationsMixin, FileListContext
         super().focusOutEvent(event)
         self._update_focus_style()
 
+    def resizeEvent(self, event) -> None:
+        """Keep the search overlay anchored to the bottom edge."""
+        super().resizeEvent(event)
+        self._place_search_label()
+
     def _update_focus_style(self) -> None:
         """Update border style based on focus and theme."""
         from commander.utils.themes import get_theme_manager
@@ -176,6 +229,11 @@ class FileListView(FileListSearchMixin, FileListOperationsMixin, FileListContext
 
     def set_root_path(self, path: Path) -> None:
         """Set the directory to display."""
+        # Re-applying the same directory (refresh after a file operation) keeps the
+        # caches - the model's watcher streams added/removed rows and they follow those
+        if path != self._current_path:
+            self._thumbnail_delegate.clear_cache()
+            self._invalidate_search_names()
         self._current_path = path
         self._model.setRootPath(str(path))
 
@@ -190,6 +248,15 @@ class FileListView(FileListSearchMixin, FileListOperationsMixin, FileListContext
         # Reconnect selection changed signals
         self._connect_selection_signals()
 
+    def _schedule_refresh(self) -> None:
+        """Refresh the current directory shortly, merging repeated requests."""
+        self._refresh_timer.start()
+
+    def _refresh(self) -> None:
+        """Re-apply the current directory."""
+        if self._current_path:
+            self.set_root_path(self._current_path)
+
     def _connect_selection_signals(self) -> None:
         """Connect selection changed signals for both views."""
         # Tree view - disconnect then reconnect
@@ -234,10 +301,47 @@ class FileListView(FileListSearchMixin, FileListOperationsMixin, FileListContext
             self._stack.setCurrentWidget(self._list_view)
             self._list_view.setViewMode(QListView.ViewMode.IconMode)
             self._list_view.setGridSize(QSize(150, 150))
-            self._list_view.setIconSize(QSize(128, 128))
+            self._list_view.setIconSize(ThumbnailDelegate.THUMBNAIL_SIZE)
             self._list_view.setSpacing(10)
             self._list_view.setWordWrap(True)
             self._list_view.setItemDelegate(self._thumbnail_delegate)
+            self._prefetch_timer.start()
+
+    def _prefetch_visible_thumbnails(self) -> None:
+        """Queue thumbnails for the visible rows, then the rows around them."""
+        if self._view_mode != ViewMode.THUMBNAILS:
+            return
+
+        view = self._list_view
+        step = view.gridSize()
+        step_w = max(step.width(), 1)
+        step_h = max(step.height(), 1)
+        viewport = view.viewport().rect()
+
+        # Sample the centre of each grid cell to find the visible row range
+        rows = [
+            index.row()
+            for y in range(step_h // 2, viewport.height(), step_h)
+            for x in range(step_w // 2, viewport.width(), step_w)
+            if (index := view.indexAt(QPoint(x, y))).isValid()
+        ]
+        if not rows:
+            return
+
+        first, last = min(rows), max(rows)
+        visible = last - first + 1
+        root_index = view.rootIndex()
+        row_count = self._model.rowCount(root_index)
+
+        # Visible rows first, then the next/previous screenful
+        order = [
+            *range(first, last + 1),
+            *range(last + 1, min(last + 1 + visible, row_count)),
+            *range(first - 1, max(first - 1 - visible, -1), -1),
+        ]
+        file_path = self._model.filePath
+        paths = [Path(file_path(self._model.index(row, 0, root_index))) for row in order]
+        self._thumbnail_delegate.prefetch(paths)
 
     def _on_clicked(self, index: QModelIndex) -> None:
         """Handle single click - select and preview."""
@@ -246,15 +350,10 @@ class FileListView(FileListSearchMixin, FileListOperationsMixin, FileListContext
 
     def _on_selection_changed(self, selected, deselected) -> None:
         """Handle selection change (keyboard navigation)."""
-        view = self._current_view()
-        indexes = view.selectionModel().selectedIndexes()
+        indexes = self._selected_name_indexes()
         if indexes:
-            # Get the first column index (name)
-            for idx in indexes:
-                if idx.column() == 0:
-                    path = Path(self._model.filePath(idx))
-                    self.item_selected.emit(path)
-                    break
+            path = Path(self._model.filePath(indexes[0]))
+            self.item_selected.emit(path)
 
     def _on_double_clicked(self, index: QModelIndex) -> None:
         """Handle double click - activate (open/navigate)."""
@@ -263,23 +362,27 @@ class FileListView(FileListSearchMixin, FileListOperationsMixin, FileListContext
 
     def get_selected_paths(self) -> list[Path]:
         """Get list of selected file paths."""
-        paths: list[Path] = []
+        file_path = self._model.filePath
+        # Dedup path strings (in order) before building Paths
+        path_strs = dict.fromkeys(file_path(i) for i in self._selected_name_indexes())
+        return [Path(path_str) for path_str in path_strs]
+
+    def _selected_name_indexes(self) -> list[QModelIndex]:
+        """Get selected indexes of the name column, one per row."""
         view = self._current_view()
-        for index in view.selectionModel().selectedIndexes():
-            if index.column() == 0:  # Only count name column
-                path = Path(self._model.filePath(index))
-                if path not in paths:
-                    paths.append(path)
-        return paths
+        selection_model = view.selectionModel()
+        if view is self._tree_view:
+            # Tree view selects whole rows - Qt picks the name column
+            return selection_model.selectedRows(0)
+        # List view selections may cover the name column only (or whole rows
+        # when set from code), so selectedRows() can't be used there
+        return [idx for idx in selection_model.selectedIndexes() if idx.column() == 0]
 
     def start_rename(self) -> None:
         """Start renaming selected item."""
-        view = self._current_view()
-        indexes = view.selectionModel().selectedIndexes()
-        for idx in indexes:
-            if idx.column() == 0:
-                view.edit(idx)
-                break
+        indexes = self._selected_name_indexes()
+        if indexes:
+            self._current_view().edit(indexes[0])
 
     def selectionModel(self):
         """Get selection model of current view (for compatibility)."""
@@ -291,13 +394,13 @@ class FileListView(FileListSearchMixin, FileListOperationsMixin, FileListContext
 
     def _select_paths(self, paths: list[Path]) -> None:
         """Select specific paths in the current view."""
-        from PySide6.QtCore import QItemSelectionModel
-
-        view = self._current_view()
-        selection_model = view.selectionModel()
-        selection_model.clear()
-
+        selection = QItemSelection()
         for path in paths:
             index = self._model.index(str(path))
             if index.isValid():
-                selection_model.select(index, QItemSelectionModel.Select | QItemSelectionModel.Rows)
+                selection.select(index, index)
+
+        # One update (and one selectionChanged) instead of a clear plus one per path
+        self._current_view().selectionModel().select(
+            selection, QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows
+        )
@@ -2,28 +2,84 @@
 
 from pathlib import Path
 
-from PySide6.QtCore import Qt, QModelIndex, QRect
+from PySide6.QtCore import Qt, QModelIndex, QPoint, QRect, QSize
 from PySide6.QtWidgets import QStyledItemDelegate, QStyle
-from PySide6.QtGui import QPainter, QColor
+from PySide6.QtGui import QPainter, QColor, QPixmap
 
 from commander.core.thumbnail_provider import get_thumbnail_provider
 from commander.utils.themes import get_file_color
 
+# Filename alignment below the thumbnail
+_TEXT_FLAGS = Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop
+
 
 class ThumbnailDelegate(QStyledItemDelegate):
     """Custom delegate for displaying image thumbnails."""
 
+    # Max cached per-item entries before the oldest are dropped
+    CACHE_SIZE = 4096
+
+    # Thumbnails are requested pre-scaled to fit this (the thumbnail mode icon size)
+    THUMBNAIL_SIZE = QSize(128, 128)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._thumbnail_provider = get_thumbnail_provider()
         self._thumbnail_provider.thumbnail_ready.connect(self._on_thumbnail_ready)
+        self._supported_exts = self._thumbnail_provider.supported_extensions()
         self._view = parent
 
+        # (row, internalId) -> (path, file name, thumbnail pixmap if any)
+        # Path is None for entries that never get a thumbnail (dirs, non-images)
+        self._cache: dict[tuple[int, int], tuple[Path | None, str, QPixmap | None]] = {}
+
+    def clear_cache(self) -> None:
+        """Drop cached item data (call when the model's root changes)."""
+        self._cache.clear()
+
+    def prefetch(self, paths: list[Path]) -> None:
+        """Request thumbnails ahead of painting (e.g. rows just off screen)."""
+        self._thumbnail_provider.prefetch(paths, self.THUMBNAIL_SIZE)
+
     def _on_thumbnail_ready(self, path_str: str) -> None:
         """Handle thumbnail ready - trigger repaint."""
+        self._cache.clear()
         if self._view:
             self._view.viewport().update()
 
+    def _item_data(self, index: QModelIndex) -> tuple[Path | None, str, QPixmap | None]:
+        """Get (thumbnail path, file name, thumbnail) for index, memoized."""
+        key = (index.row(), index.internalId())
+        entry = self._cache.get(key)
+        if entry is not None and (entry[0] is None or entry[2] is not None):
+            return entry
+
+        if entry is None:
+            model = index.model()
+            file_path = Path(model.filePath(index))
+            # Cheap suffix test first; the model's cached file info avoids a stat
+            if not (
+                file_path.suffix.lower() in self._supported_exts and model.fileInfo(index).isFile()
+            ):
+                file_path = None
+            file_name = model.fileName(index)
+        else:
+            file_path, file_name, _ = entry
+
+        # Still loading entries re-query the provider until the pixmap arrives
+        thumbnail = (
+            self._thumbnail_provider.get_thumbnail(file_path, self.THUMBNAIL_SIZE)
+            if file_path
+            else None
+        )
+        entry = (file_path, file_name, thumbnail)
+
+        if len(self._cache) >= self.CACHE_SIZE:
+            # Dicts keep insertion order - drop the oldest entry
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = entry
+        return entry
+
     def _get_text_color(self, file_path: Path, option, is_selected: bool) -> QColor:
         """Get text color based on file type."""
         if is_selected:
@@ -37,49 +93,33 @@ class ThumbnailDelegate(QStyledItemDelegate):
 
     def paint(self, painter: QPainter, option, index: QModelIndex) -> None:
         """Paint the item with thumbnail if available."""
-        # Get file path from model
-        model = index.model()
-        file_path = Path(model.filePath(index))
-
-        # Check if it's an image and we have a thumbnail
-        thumbnail = None
-        if file_path.is_file() and self._thumbnail_provider.is_supported(file_path):
-            thumbnail = self._thumbnail_provider.get_thumbnail(file_path)
-
-        is_selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        # Get file path, name and thumbnail (cached per item)
+        file_path, file_name, thumbnail = self._item_data(index)
 
         if thumbnail:
+            is_selected = bool(option.state & QStyle.StateFlag.State_Selected)
+            rect = option.rect
+
             # Draw selection background
             if is_selected:
-                painter.fillRect(option.rect, option.palette.highlight())
-
-            # Calculate centered position for thumbnail
-            thumb_rect = QRect(
-                option.rect.x() + (option.rect.width() - thumbnail.width()) // 2,
-                option.rect.y() + 5,
-                thumbnail.width(),
-                thumbnail.height(),
+                painter.fillRect(rect, option.palette.highlight())
+
+            # Thumbnail is already scaled - draw it unscaled, centered horizontally
+            painter.drawPixmap(
+                QPoint(rect.x() + (rect.width() - thumbnail.width()) // 2, rect.y() + 5),
+                thumbnail,
             )
-            painter.drawPixmap(thumb_rect, thumbnail)
 
             # Draw filename below thumbnail
-            text_rect = QRect(
-                option.rect.x(),
-                option.rect.y() + option.rect.height() - 35,
-                option.rect.width(),
-                30,
-            )
+            text_rect = QRect(rect.x(), rect.y() + rect.height() - 35, rect.width(), 30)
 
             text_color = self._get_text_color(file_path, option, is_selected)
             painter.setPen(text_color)
 
-            file_name = model.fileName(index)
             elided = painter.fontMetrics().elidedText(
                 file_name, Qt.TextElideMode.ElideMiddle, text_rect.width() - 4
             )
-            painter.drawText(
-                text_rect, Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop, elided
-            )
+            painter.drawText(text_rect, _TEXT_FLAGS, elided)
         else:
             # Default painting for non-images
             super().paint(painter, option, index)
@@ -91,6 +91,7 @@ class ProgressDialog(QDialog):
         self._start_time = time.time()
         self._result = 0
         self._conflict_resolution = conflict_resolution
+        self._worker: FileOperationWorker | None = None
 
         self._setup_ui()
 
@@ -234,7 +235,8 @@ class ProgressDialog(QDialog):
 
     def _cancel(self):
         """Cancel the operation."""
-        self._worker.cancel()
+        if self._worker is not None:
+            self._worker.cancel()
         self._cancel_btn.setEnabled(False)
         self._cancel_btn.setText("Cancelling...")
 
@@ -264,9 +266,22 @@ class ProgressDialog(QDialog):
             mins = int((seconds % 3600) / 60)
             return f"{hours}h {mins}m"
 
-    def closeEvent(self, event):
-        """Handle close - cancel operation."""
-        if self._worker.isRunning():
+    def _stop_worker(self) -> None:
+        """Cancel the worker if it is still running and wait for its thread to end."""
+        if self._worker is not None and self._worker.isRunning():
             self._worker.cancel()
             self._worker.wait()
+
+    def done(self, result: int) -> None:
+        """Close the dialog - never while the worker thread is still running.
+
+        Callers may delete the dialog (and with it the worker) once it is finished,
+        including after Esc/reject on a non-modal dialog.
+        """
+        self._stop_worker()
+        super().done(result)
+
+    def closeEvent(self, event):
+        """Handle close - cancel operation."""
+        self._stop_worker()
         super().closeEvent(event)
@@ -0,0 +1,51 @@
+"""Tests for ArchiveManager extraction planning."""
+
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from commander.core.archive_handler import HAS_PY7ZR, HAS_RARFILE, ArchiveManager
+
+
+def make_zip(path: Path, names: list[str]) -> Path:
+    """Create a ZIP archive containing the given (empty) entries."""
+    with zipfile.ZipFile(path, "w") as zf:
+        for name in names:
+            zf.writestr(name, "")
+    return path
+
+
+class TestSmartExtractRoot:
+    """Test the top-level path smart_extract() writes into."""
+
+    def test_single_folder(self, temp_dir: Path):
+        """Test an archive with one top-level folder writes into that folder."""
+        archive = make_zip(temp_dir / "a.zip", ["shared/x.txt", "shared/y.txt"])
+        assert ArchiveManager.smart_extract_root(archive, temp_dir) == temp_dir / "shared"
+        assert ArchiveManager.smart_extract(archive, temp_dir) == temp_dir
+        assert (temp_dir / "shared" / "x.txt").exists()
+
+    def test_wrapper_folder(self, temp_dir: Path):
+        """Test an archive with top-level files writes into a folder named after it."""
+        archive = make_zip(temp_dir / "a.zip", ["x.txt", "y.txt"])
+        assert ArchiveManager.smart_extract_root(archive, temp_dir) == temp_dir / "a"
+        assert ArchiveManager.smart_extract(archive, temp_dir) == temp_dir / "a"
+
+
+@pytest.mark.skipif(not (HAS_RARFILE and HAS_PY7ZR), reason="rarfile/py7zr not installed")
+@pytest.mark.parametrize(
+    ("name", "first"),
+    [
+        ("x.part2.rar", "x.part1.rar"),
+        ("x.part02.rar", "x.part01.rar"),
+        ("x.part1.rar", "x.part1.rar"),
+        ("x.r00", "x.rar"),
+        ("x.7z.002", "x.7z.001"),
+        ("x.7z.0003", "x.7z.0001"),
+        ("x.zip", "x.zip"),
+    ],
+)
+def test_get_first_volume(name: str, first: str):
+    """Test later volumes of split archives map to the first volume."""
+    assert ArchiveManager.get_first_volume(Path("/d") / name) == Path("/d") / first
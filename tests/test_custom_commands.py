@@ -0,0 +1,46 @@
+"""Tests for custom command shortcuts."""
+
+from pathlib import Path
+
+import pytest
+
+from commander.utils.custom_commands import CustomCommand, CustomCommandsManager
+
+
+@pytest.fixture
+def manager(temp_dir: Path, monkeypatch):
+    """Get a CustomCommandsManager with an empty command list stored in temp_dir."""
+    monkeypatch.setattr(
+        CustomCommandsManager, "_get_config_path", lambda self: temp_dir / "custom_commands.json"
+    )
+    mgr = CustomCommandsManager()
+    mgr._commands = []
+    return mgr
+
+
+class TestShortcuts:
+    """Test looking up commands by shortcut key."""
+
+    def test_first_matching_command_wins(self, manager: CustomCommandsManager, source_dir: Path):
+        """Test commands sharing a key are filtered by path, in list order."""
+        images = CustomCommand("View", "view {path}", extensions=["png"], shortcut="v")
+        texts = CustomCommand("Edit", "edit {path}", extensions=["txt"], shortcut="V")
+        manager.add_command(images)
+        manager.add_command(texts)
+
+        assert manager.get_command_for_shortcut(source_dir / "image.png", "V") is images
+        assert manager.get_command_for_shortcut(source_dir / "file1.txt", "V") is texts
+        assert manager.get_command_for_shortcut(source_dir / "file1.txt", "X") is None
+
+    def test_changes_update_shortcuts(self, manager: CustomCommandsManager, source_dir: Path):
+        """Test updated and removed commands are seen by the next lookup."""
+        path = source_dir / "file1.txt"
+        manager.add_command(CustomCommand("Edit", "edit {path}", shortcut="E"))
+        assert manager.get_command_for_shortcut(path, "E") is not None
+
+        manager.update_command(0, CustomCommand("Edit", "edit {path}", shortcut="T"))
+        assert manager.get_command_for_shortcut(path, "E") is None
+        assert manager.get_command_for_shortcut(path, "T") is not None
+
+        manager.remove_command(0)
+        assert manager.get_command_for_shortcut(path, "T") is None
@@ -0,0 +1,133 @@
+"""Tests for fuzzy filename matching."""
+
+import pytest
+
+from commander.utils.fuzzy_match import HAS_NUMBA, fuzzy_score
+
+
+NAMES = ["readme.md", "report.txt", "image01.png", "img05.png", "notes", "é_accent.txt", ""]
+
+
+def reference_score(pattern: str, text: str) -> int:
+    """Straightforward per-character scorer that fuzzy_score must agree with."""
+    if not pattern:
+        return 0
+    if text.startswith(pattern):
+        return 1000 + len(pattern)
+
+    pattern_idx = 0
+    score = 0
+    consecutive = 0
+    for i, char in enumerate(text):
+        if pattern_idx < len(pattern) and char == pattern[pattern_idx]:
+            pattern_idx += 1
+            consecutive += 1
+            score += consecutive * 10
+            if i == 0:
+                score += 50
+        else:
+            consecutive = 0
+    return score if pattern_idx == len(pattern) else 0
+
+
+class TestFuzzyScore:
+    """Test the pure Python scorer."""
+
+    def test_prefix_beats_fuzzy(self):
+        """Test exact prefix match scores above any in-order match."""
+        assert fuzzy_score("rep", "report.txt") == 1003
+        assert 0 < fuzzy_score("rpt", "report.txt") < 1000
+
+    def test_characters_must_appear_in_order(self):
+        """Test no match when pattern characters are out of order."""
+        assert fuzzy_score("tpr", "report.txt") == 0
+
+    def test_consecutive_matches_score_higher(self):
+        """Test consecutive characters score above scattered ones."""
+        assert fuzzy_score("age", "image01.png") > fuzzy_score("ae1", "image01.png")
+
+    def test_empty_pattern(self):
+        """Test empty pattern never matches."""
+        assert fuzzy_score("", "anything") == 0
+
+    @pytest.mark.parametrize(
+        "pattern", ["a", "ab", "aab", "abc", "re", "rpt", "png", "i5p", "é", "zzz", "xaxbxc"]
+    )
+    def test_matches_reference_scorer(self, pattern):
+        """Test scores match the per-character reference for every name."""
+        for name in NAMES + ["aaa", "abab", "xaxbxc", "aab.aab", "ab"]:
+            assert fuzzy_score(pattern, name) == reference_score(pattern, name), name
+
+
+@pytest.mark.skipif(not HAS_NUMBA, reason="numba not installed")
+class TestPackedNames:
+    """Test the compiled scorer matches the pure Python one."""
+
+    @pytest.mark.parametrize("pattern", ["re", "rpt", "png", "i5p", "é", "zzz", "notes!"])
+    def test_scores_match_python(self, pattern):
+        """Test every row scores the same as fuzzy_score."""
+        from commander.utils.fuzzy_match import PackedNames
+
+        packed = PackedNames(NAMES)
+        scores = packed.score_rows(pattern, list(range(len(NAMES))))
+        assert scores.tolist() == [fuzzy_score(pattern, name) for name in NAMES]
+
+    def test_scores_subset_of_rows(self):
+        """Test scoring only selected rows, in the given order."""
+        from commander.utils.fuzzy_match import PackedNames
+
+        packed = PackedNames(NAMES)
+        assert packed.score_rows("png", [3, 2]).tolist() == [
+            fuzzy_score("png", NAMES[3]),
+            fuzzy_score("png", NAMES[2]),
+        ]
+
+    def test_jit_without_cache_locator(self, monkeypatch):
+        """Test functions still compile when numba can't cache them."""
+        from commander.utils import fuzzy_match
+
+        real_njit = fuzzy_match.njit
+
+        def njit(*args, cache=False):
+            if cache:
+                raise RuntimeError("cannot cache function: no locator available")
+            return real_njit(*args)
+
+        monkeypatch.setattr(fuzzy_match, "njit", njit)
+        assert fuzzy_match._jit(lambda x: x + 1)(1) == 2
+
+    def test_best_match(self):
+        """Test best row and hits agree with a Python max over the same rows."""
+        from commander.utils.fuzzy_match import PackedNames
+
+        packed = PackedNames(NAMES)
+        rows = list(range(len(NAMES)))
+        scores = [fuzzy_score("png", name) for name in NAMES]
+        assert packed.best_match("png", rows) == (
+            scores.index(max(scores)),
+            [row for row in rows if scores[row] > 0],
+        )
+        assert packed.best_match("zzz", rows) == (None, [])
+
+
+class TestFindBestMatch:
+    """Test the file list's type-to-search picks rows by fuzzy_score."""
+
+    NAMES = ["photo.jpg", "report.txt", "script.py"]
+
+    @pytest.mark.parametrize(
+        ("pattern", "expected"),
+        [("rep", "report.txt"), ("rpt", "report.txt"), ("ptj", "photo.jpg"), ("scr", "script.py")],
+    )
+    def test_letters_in_order(self, pattern, expected):
+        """Test the match has the pattern's letters in order, whatever is installed."""
+        from commander.views.file_list.file_list_search import FileListSearchMixin
+
+        row = FileListSearchMixin()._find_best_match(pattern, self.NAMES)
+        assert self.NAMES[row] == expected
+
+    def test_no_match(self):
+        """Test None when no name has the pattern's letters in order."""
+        from commander.views.file_list.file_list_search import FileListSearchMixin
+
+        assert FileListSearchMixin()._find_best_match("jtp", self.NAMES) is None
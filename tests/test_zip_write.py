@@ -0,0 +1,45 @@
+"""Tests for writing files into ZIP archives."""
+
+import zipfile
+from pathlib import Path
+
+from commander.views.file_list.file_list_operations import _zip_write
+
+
+def test_compression_per_suffix(temp_dir: Path):
+    """Test already-compressed formats are stored and other files deflated."""
+    files = {
+        "image.png": b"\x89PNG\r\n\x1a\n",
+        "photo.JPG": b"\xff\xd8\xff",
+        "notes.txt": b"a" * 1000,
+    }
+    zip_path = temp_dir / "out.zip"
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in files.items():
+            (temp_dir / name).write_bytes(data)
+            _zip_write(zf, str(temp_dir / name), name)
+
+    with zipfile.ZipFile(zip_path) as zf:
+        assert zf.testzip() is None
+        compress_types = {info.filename: info.compress_type for info in zf.infolist()}
+        assert {name: zf.read(name) for name in files} == files
+
+    assert compress_types == {
+        "image.png": zipfile.ZIP_STORED,
+        "photo.JPG": zipfile.ZIP_STORED,
+        "notes.txt": zipfile.ZIP_DEFLATED,
+    }
+
+
+def test_small_entries_without_zip64(temp_dir: Path):
+    """Test small entries carry no ZIP64 extra field."""
+    source = temp_dir / "small.txt"
+    source.write_text("content")
+    zip_path = temp_dir / "out.zip"
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        _zip_write(zf, str(source), "small.txt")
+
+    with zipfile.ZipFile(zip_path) as zf:
+        info = zf.getinfo("small.txt")
+        assert info.extract_version == 20
+        assert info.extra == b""